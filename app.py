@@ -1,17 +1,164 @@
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import plotly.express as px
 import plotly.graph_objects as go
-from modules.completeness import CompletenessChecker
-from modules.consistency import ConsistencyChecker
-from modules.accuracy import AccuracyChecker
-from modules.security import SecurityChecker
-from modules.timeliness import TimelinessChecker
-from modules.usability import UsabilityChecker
+from modules.loader import FAST_PARSE_AVAILABLE, read_csv
+from modules.runner import CHECKERS, iter_checks
+from modules.semantics import column_tags
+from modules.utils import render_metrics
 from theoretical_framework import show_theoretical_framework
 
+try:
+    # orjson: 리포트 JSON 직렬화 가속 (선택 의존성)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _hash_dataframe(df):
+    """캐시 키용 DataFrame 해시 (컬럼 구성 + 행 단위 해시)"""
+    return (
+        tuple(df.columns),
+        tuple(str(dtype) for dtype in df.dtypes),
+        df.shape,
+        pd.util.hash_pandas_object(df, index=True).values.tobytes()
+    )
+
+
+@st.cache_data
+def load_csv(file_bytes, fast_parse=True):
+    """업로드된 CSV 파일 로드 (파일 내용 기준 캐시)"""
+    return read_csv(file_bytes, fast_parse)
+
+
+@st.cache_data
+def load_sample_csv(path):
+    """샘플 CSV 파일 로드"""
+    return pd.read_csv(path)
+
+
+@st.cache_data(hash_funcs={pd.DataFrame: _hash_dataframe})
+def summarize_dataframe(df):
+    """미리보기용 메모리 사용량(KB) 및 NULL 개수"""
+    memory_kb = df.memory_usage(deep=True).sum() / 1024
+    null_count = df.isnull().sum().sum()
+    return memory_kb, null_count
+
+
+# 진단 지표별 표시명
+CHECK_LABELS = {
+    'completeness': '완전성',
+    'consistency': '일관성',
+    'accuracy': '정확성',
+    'security': '보안성',
+    'timeliness': '적시성',
+    'usability': '유용성',
+}
+
+
+# 진단 결과 저장소 최대 항목 수 (데이터 + 지표 + 옵션 조합)
+RESULT_CACHE_SIZE = 64
+
+
+@st.cache_resource
+def result_store():
+    """지표별 진단 결과 저장소 (세션 간 공유)"""
+    return {}
+
+
+def _dataframe_key(df):
+    """진단 결과 저장소 키용 DataFrame 지문"""
+    columns, dtypes, shape, row_hashes = _hash_dataframe(df)
+    digest = hashlib.sha256(repr((columns, dtypes, shape)).encode())
+    digest.update(row_hashes)
+    return digest.hexdigest()
+
+
+def iter_cached_checks(names, df, options=None):
+    """
+    저장된 결과는 바로 반환하고, 나머지 지표는 병렬 진단하여 완료 순서대로 반환
+
+    Yields:
+        tuple: (지표명, 진단 결과)
+    """
+    store = result_store()
+    data_key = _dataframe_key(df)
+    keys = {name: (data_key, name, repr((options or {}).get(name))) for name in names}
+
+    pending = []
+    for name in names:
+        if keys[name] in store:
+            yield name, store[keys[name]]
+        else:
+            pending.append(name)
+
+    for name, result in iter_checks(pending, df, options):
+        store[keys[name]] = result
+        # 오래된 결과부터 제거
+        while len(store) > RESULT_CACHE_SIZE:
+            store.pop(next(iter(store)))
+        yield name, result
+
+
+@st.fragment
+def render_result_panel(key):
+    """지표별 상세 진단 결과 (지표 단위로만 다시 그림)"""
+    result = st.session_state['results'][key]
+
+    with st.expander(f"**{result.get('name', key)}** - {result.get('score', 0):.1f}점", expanded=True):
+
+        # 이슈 요약
+        if 'issues' in result and result['issues']:
+            # 심각도별 이슈 개수
+            severity_counts = result['severity_counts']
+
+            # 요약 표시
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("전체 이슈", len(result['issues']))
+            with col2:
+                st.metric("🔴 높음", severity_counts['high'])
+            with col3:
+                st.metric("🟡 중간", severity_counts['medium'])
+            with col4:
+                st.metric("🟢 낮음", severity_counts['low'])
+
+            st.markdown("---")
+
+            for i, issue in enumerate(result['issues'], 1):
+                # 심각도에 따른 색상 구분
+                if '🔴' in issue.get('severity', ''):
+                    st.error(f"**{i}. {issue['title']}**")
+                elif '🟡' in issue.get('severity', ''):
+                    st.warning(f"**{i}. {issue['title']}**")
+                else:
+                    st.info(f"**{i}. {issue['title']}**")
+
+                st.markdown(f"- **심각도**: {issue.get('severity', 'N/A')}")
+                st.markdown(f"- **설명**: {issue.get('description', 'N/A')}")
+
+                if 'details' in issue:
+                    with st.expander("📊 상세 정보"):
+                        st.json(issue['details'])
+
+                st.markdown("---")
+        else:
+            st.success("✅ 이슈가 발견되지 않았습니다.")
+
+        # 상세 메트릭
+        if 'metrics' in result:
+            st.markdown("**📊 상세 메트릭**")
+            metrics = render_metrics(result['metrics'], getattr(CHECKERS.get(key), 'METRIC_FORMATS', None))
+            metric_cols = st.columns(len(metrics))
+
+            for i, (metric_name, metric_value) in enumerate(metrics.items()):
+                with metric_cols[i]:
+                    st.metric(metric_name, metric_value)
+
+
 # 페이지 설정
 st.set_page_config(
     page_title="데이터 품질 진단 툴",
@@ -42,6 +189,13 @@ with st.sidebar:
         help="진단할 데이터베이스 CSV 파일을 업로드하세요"
     )
 
+    fast_parse = st.checkbox(
+        "고속 파싱",
+        value=True,
+        disabled=not FAST_PARSE_AVAILABLE,
+        help="pyarrow 멀티스레드 CSV 파서로 파일을 읽습니다. (pyarrow 설치 필요)"
+    )
+
     st.markdown("---")
 
     # 진단 지표 선택
@@ -56,6 +210,26 @@ with st.sidebar:
 
     st.markdown("---")
 
+    # 대용량 데이터 옵션
+    st.header("⚡ 성능 옵션")
+
+    fast_mode = st.checkbox(
+        "빠른 모드",
+        value=False,
+        help="대용량 데이터는 표본으로 먼저 검사하고, 이슈가 발견된 컬럼만 전체 데이터로 정밀 검사합니다. (정확성 진단) 완전성/일관성 진단의 타입·날짜 형식 추론은 표본으로만 수행합니다."
+    )
+    sample_threshold = st.slider(
+        "정확 모드 임계치",
+        min_value=50_000,
+        max_value=1_000_000,
+        value=200_000,
+        step=50_000,
+        disabled=not fast_mode,
+        help="레코드 수가 이 값 이하이면 전체 데이터를 검사하고, 초과하면 이 크기의 표본으로 1차 검사합니다."
+    )
+
+    st.markdown("---")
+
     # 샘플 데이터 로드
     if st.button("📂 샘플 데이터 사용"):
         st.session_state['use_sample'] = True
@@ -65,25 +239,26 @@ if uploaded_file is not None or st.session_state.get('use_sample', False):
 
     # 데이터 로드
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
+        df = load_csv(uploaded_file.getvalue(), fast_parse)
         st.success(f"✅ 파일 업로드 완료: {uploaded_file.name}")
     else:
-        df = pd.read_csv('sample_data/sample_customer.csv')
+        df = load_sample_csv('sample_data/sample_customer.csv')
         st.info("📂 샘플 데이터를 사용합니다.")
 
     # 데이터 미리보기
     with st.expander("🔍 데이터 미리보기", expanded=False):
         st.dataframe(df.head(10), use_container_width=True)
 
+        memory_kb, null_count = summarize_dataframe(df)
+
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("전체 레코드 수", f"{len(df):,}")
         with col2:
             st.metric("컬럼 수", len(df.columns))
         with col3:
-            st.metric("메모리 사용량", f"{df.memory_usage(deep=True).sum() / 1024:.2f} KB")
+            st.metric("메모리 사용량", f"{memory_kb:.2f} KB")
         with col4:
-            null_count = df.isnull().sum().sum()
             st.metric("NULL 값 개수", f"{null_count:,}")
 
     st.markdown("---")
@@ -91,251 +266,190 @@ if uploaded_file is not None or st.session_state.get('use_sample', False):
     # 진단 실행 버튼
     if st.button("🚀 진단 시작", type="primary"):
 
-        results = {}
+        selected_checks = tuple(
+            name
+            for name, enabled in [
+                ('completeness', check_completeness),
+                ('consistency', check_consistency),
+                ('accuracy', check_accuracy),
+                ('security', check_security),
+                ('timeliness', check_timeliness),
+                ('usability', check_usability),
+            ]
+            if enabled
+        )
+
+        # 컬럼 의미 분류는 한 번만 수행하여 모든 진단 모듈에 공유
+        tags = column_tags(df)
+
+        # 완전성 진단은 컬럼 의미 태그를 사용하지 않음
+        check_options = {name: {} if name == 'completeness' else {'tags': tags} for name in selected_checks}
+        # 빠른 모드 옵션은 표본 검사를 지원하는 지표에만 전달
+        for name in ('completeness', 'consistency', 'accuracy'):
+            if name in check_options:
+                check_options[name].update(fast_mode=fast_mode, sample_threshold=sample_threshold)
 
         # 진행 상태 표시
         progress_bar = st.progress(0)
         status_text = st.empty()
+        status_text.text("진단 중...")
 
-        total_checks = sum([
-            check_completeness,
-            check_consistency,
-            check_accuracy,
-            check_security,
-            check_timeliness,
-            check_usability
-        ])
-
-        current_check = 0
-
-        # 완전성 진단
-        if check_completeness:
-            status_text.text("완전성 진단 중...")
-            checker = CompletenessChecker(df)
-            results['completeness'] = checker.check()
-            current_check += 1
-            progress_bar.progress(current_check / total_checks)
-
-        # 일관성 진단
-        if check_consistency:
-            status_text.text("일관성 진단 중...")
-            checker = ConsistencyChecker(df)
-            results['consistency'] = checker.check()
-            current_check += 1
-            progress_bar.progress(current_check / total_checks)
-
-        # 정확성 진단
-        if check_accuracy:
-            status_text.text("정확성 진단 중...")
-            checker = AccuracyChecker(df)
-            results['accuracy'] = checker.check()
-            current_check += 1
-            progress_bar.progress(current_check / total_checks)
-
-        # 보안성 진단
-        if check_security:
-            status_text.text("보안성 진단 중...")
-            checker = SecurityChecker(df)
-            results['security'] = checker.check()
-            current_check += 1
-            progress_bar.progress(current_check / total_checks)
-
-        # 적시성 진단
-        if check_timeliness:
-            status_text.text("적시성 진단 중...")
-            checker = TimelinessChecker(df)
-            results['timeliness'] = checker.check()
-            current_check += 1
-            progress_bar.progress(current_check / total_checks)
-
-        # 유용성 진단
-        if check_usability:
-            status_text.text("유용성 진단 중...")
-            checker = UsabilityChecker(df)
-            results['usability'] = checker.check()
-            current_check += 1
-            progress_bar.progress(current_check / total_checks)
-
-        progress_bar.progress(1.0)
-        status_text.text("✅ 진단 완료!")
-
-        st.session_state['results'] = results
+        st.session_state['results'] = {}
+        running_checks = selected_checks
+    else:
+        running_checks = ()
 
     # 진단 결과 표시
     if 'results' in st.session_state:
         st.markdown("---")
         st.header("📊 진단 결과")
 
-        results = st.session_state['results']
-
-        # 전체 품질 점수 계산
-        total_score = 0
-        total_weight = 0
-
-        for key, result in results.items():
-            if 'score' in result:
-                total_score += result['score']
-                total_weight += 1
-
-        overall_score = total_score / total_weight if total_weight > 0 else 0
-
-        # 전체 점수 표시
-        col1, col2, col3 = st.columns([2, 1, 1])
-
-        with col1:
-            st.metric(
-                "전체 데이터 품질 점수",
-                f"{overall_score:.1f}점",
-                help="100점 만점 기준"
-            )
-
-            # 품질 등급 표시
-            if overall_score >= 90:
-                grade = "🟢 우수"
-                grade_color = "green"
-            elif overall_score >= 70:
-                grade = "🟡 양호"
-                grade_color = "orange"
-            elif overall_score >= 50:
-                grade = "🟠 보통"
-                grade_color = "orange"
-            else:
-                grade = "🔴 미흡"
-                grade_color = "red"
-
-            st.markdown(f"**품질 등급**: :{grade_color}[{grade}]")
-
-        with col2:
-            st.metric("진단 지표 수", len(results))
-
-        with col3:
-            st.metric("진단 일시", datetime.now().strftime("%Y-%m-%d %H:%M"))
-
-        # 점수 차트
-        st.markdown("### 📈 지표별 품질 점수")
-
-        score_data = []
-        for key, result in results.items():
-            if 'score' in result:
-                score_data.append({
-                    '지표': result.get('name', key),
-                    '점수': result['score']
-                })
-
-        if score_data:
-            score_df = pd.DataFrame(score_data)
-
-            fig = px.bar(
-                score_df,
-                x='지표',
-                y='점수',
-                color='점수',
-                color_continuous_scale=['red', 'yellow', 'green'],
-                range_color=[0, 100],
-                text='점수'
-            )
-
-            fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
-            fig.update_layout(
-                yaxis_range=[0, 105],
-                showlegend=False,
-                height=400
-            )
-
-            st.plotly_chart(fig, use_container_width=True)
-
-        # 심각도별 이슈 요약 차트
-        st.markdown("### ⚠️ 심각도별 이슈 현황")
-
-        severity_data = []
-        for key, result in results.items():
-            if 'issues' in result and result['issues']:
-                high_count = len([i for i in result['issues'] if '🔴' in i.get('severity', '')])
-                medium_count = len([i for i in result['issues'] if '🟡' in i.get('severity', '')])
-                low_count = len([i for i in result['issues'] if '🟢' in i.get('severity', '')])
-
-                if high_count > 0:
-                    severity_data.append({'지표': result.get('name', key), '심각도': '🔴 높음', '개수': high_count})
-                if medium_count > 0:
-                    severity_data.append({'지표': result.get('name', key), '심각도': '🟡 중간', '개수': medium_count})
-                if low_count > 0:
-                    severity_data.append({'지표': result.get('name', key), '심각도': '🟢 낮음', '개수': low_count})
-
-        if severity_data:
-            severity_df = pd.DataFrame(severity_data)
-
-            fig = px.bar(
-                severity_df,
-                x='지표',
-                y='개수',
-                color='심각도',
-                color_discrete_map={'🔴 높음': 'red', '🟡 중간': 'orange', '🟢 낮음': 'green'},
-                barmode='stack',
-                text='개수'
-            )
-
-            fig.update_traces(textposition='inside')
-            fig.update_layout(height=400)
-
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.success("✅ 발견된 이슈가 없습니다!")
+        # 전체 요약은 모든 지표 진단이 끝난 뒤 채움
+        summary_container = st.container()
 
         # 상세 결과
         st.markdown("---")
         st.markdown("### 📋 상세 진단 결과")
 
-        for key, result in results.items():
-            with st.expander(f"**{result.get('name', key)}** - {result.get('score', 0):.1f}점", expanded=True):
+        if running_checks:
+            # 완료되는 지표부터 선택 순서의 자리에 바로 표시
+            panels = {name: st.empty() for name in running_checks}
 
-                # 이슈 요약
-                if 'issues' in result and result['issues']:
-                    # 심각도별로 이슈 그룹화
-                    high_issues = [i for i in result['issues'] if '🔴' in i.get('severity', '')]
-                    medium_issues = [i for i in result['issues'] if '🟡' in i.get('severity', '')]
-                    low_issues = [i for i in result['issues'] if '🟢' in i.get('severity', '')]
-
-                    # 요약 표시
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("전체 이슈", len(result['issues']))
-                    with col2:
-                        st.metric("🔴 높음", len(high_issues))
-                    with col3:
-                        st.metric("🟡 중간", len(medium_issues))
-                    with col4:
-                        st.metric("🟢 낮음", len(low_issues))
-
-                    st.markdown("---")
-
-                    for i, issue in enumerate(result['issues'], 1):
-                        # 심각도에 따른 색상 구분
-                        if '🔴' in issue.get('severity', ''):
-                            st.error(f"**{i}. {issue['title']}**")
-                        elif '🟡' in issue.get('severity', ''):
-                            st.warning(f"**{i}. {issue['title']}**")
-                        else:
-                            st.info(f"**{i}. {issue['title']}**")
-
-                        st.markdown(f"- **심각도**: {issue.get('severity', 'N/A')}")
-                        st.markdown(f"- **설명**: {issue.get('description', 'N/A')}")
-
-                        if 'details' in issue:
-                            with st.expander("📊 상세 정보"):
-                                st.json(issue['details'])
-
-                        st.markdown("---")
-                else:
-                    st.success("✅ 이슈가 발견되지 않았습니다.")
+            for name, result in iter_cached_checks(running_checks, df, check_options):
+                st.session_state['results'][name] = result
+                with panels[name].container():
+                    render_result_panel(name)
 
-                # 상세 메트릭
-                if 'metrics' in result:
-                    st.markdown("**📊 상세 메트릭**")
-                    metric_cols = st.columns(len(result['metrics']))
+                done = len(st.session_state['results'])
+                status_text.text(f"{CHECK_LABELS[name]} 진단 완료 ({done}/{len(running_checks)})")
+                progress_bar.progress(done / len(running_checks))
 
-                    for i, (metric_name, metric_value) in enumerate(result['metrics'].items()):
-                        with metric_cols[i]:
-                            st.metric(metric_name, metric_value)
+            progress_bar.progress(1.0)
+            status_text.text("✅ 진단 완료!")
+
+            # 완료 순서와 무관하게 선택 순서대로 정렬
+            st.session_state['results'] = {
+                name: st.session_state['results'][name] for name in running_checks
+            }
+        else:
+            for key in st.session_state['results']:
+                render_result_panel(key)
+
+        with summary_container:
+            results = st.session_state['results']
+
+            # 전체 품질 점수 계산
+            total_score = 0
+            total_weight = 0
+
+            for key, result in results.items():
+                if 'score' in result:
+                    total_score += result['score']
+                    total_weight += 1
+
+            overall_score = total_score / total_weight if total_weight > 0 else 0
+
+            # 전체 점수 표시
+            col1, col2, col3 = st.columns([2, 1, 1])
+
+            with col1:
+                st.metric(
+                    "전체 데이터 품질 점수",
+                    f"{overall_score:.1f}점",
+                    help="100점 만점 기준"
+                )
+
+                # 품질 등급 표시
+                if overall_score >= 90:
+                    grade = "🟢 우수"
+                    grade_color = "green"
+                elif overall_score >= 70:
+                    grade = "🟡 양호"
+                    grade_color = "orange"
+                elif overall_score >= 50:
+                    grade = "🟠 보통"
+                    grade_color = "orange"
+                else:
+                    grade = "🔴 미흡"
+                    grade_color = "red"
+
+                st.markdown(f"**품질 등급**: :{grade_color}[{grade}]")
+
+            with col2:
+                st.metric("진단 지표 수", len(results))
+
+            with col3:
+                st.metric("진단 일시", datetime.now().strftime("%Y-%m-%d %H:%M"))
+
+            # 점수 차트
+            st.markdown("### 📈 지표별 품질 점수")
+
+            score_data = []
+            for key, result in results.items():
+                if 'score' in result:
+                    score_data.append({
+                        '지표': result.get('name', key),
+                        '점수': result['score']
+                    })
+
+            if score_data:
+                score_df = pd.DataFrame(score_data)
+
+                fig = px.bar(
+                    score_df,
+                    x='지표',
+                    y='점수',
+                    color='점수',
+                    color_continuous_scale=['red', 'yellow', 'green'],
+                    range_color=[0, 100],
+                    text='점수'
+                )
+
+                fig.update_traces(texttemplate='%{text:.1f}', textposition='outside')
+                fig.update_layout(
+                    yaxis_range=[0, 105],
+                    showlegend=False,
+                    height=400
+                )
+
+                st.plotly_chart(fig, use_container_width=True)
+
+            # 심각도별 이슈 요약 차트
+            st.markdown("### ⚠️ 심각도별 이슈 현황")
+
+            severity_data = []
+            for key, result in results.items():
+                if 'issues' in result and result['issues']:
+                    high_count = result['severity_counts']['high']
+                    medium_count = result['severity_counts']['medium']
+                    low_count = result['severity_counts']['low']
+
+                    if high_count > 0:
+                        severity_data.append({'지표': result.get('name', key), '심각도': '🔴 높음', '개수': high_count})
+                    if medium_count > 0:
+                        severity_data.append({'지표': result.get('name', key), '심각도': '🟡 중간', '개수': medium_count})
+                    if low_count > 0:
+                        severity_data.append({'지표': result.get('name', key), '심각도': '🟢 낮음', '개수': low_count})
+
+            if severity_data:
+                severity_df = pd.DataFrame(severity_data)
+
+                fig = px.bar(
+                    severity_df,
+                    x='지표',
+                    y='개수',
+                    color='심각도',
+                    color_discrete_map={'🔴 높음': 'red', '🟡 중간': 'orange', '🟢 낮음': 'green'},
+                    barmode='stack',
+                    text='개수'
+                )
+
+                fig.update_traces(textposition='inside')
+                fig.update_layout(height=400)
+
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.success("✅ 발견된 이슈가 없습니다!")
 
         # 리포트 다운로드
         st.markdown("---")
@@ -350,11 +464,21 @@ if uploaded_file is not None or st.session_state.get('use_sample', False):
                 'results': results
             }
 
-            json_str = json.dumps(report, ensure_ascii=False, indent=2)
+            json_data = None
+            if orjson is not None:
+                try:
+                    json_data = orjson.dumps(
+                        report,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                    )
+                except TypeError:
+                    pass
+            if json_data is None:
+                json_data = json.dumps(report, ensure_ascii=False, indent=2)
 
             st.download_button(
                 label="다운로드",
-                data=json_str,
+                data=json_data,
                 file_name=f"dq_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json"
             )
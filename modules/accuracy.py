@@ -7,43 +7,150 @@ Accuracy Checker Module
 
 import pandas as pd
 import numpy as np
+import copy
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from modules.utils import count_severities, count_out_of_range, count_later, scan_range, SAMPLE_THRESHOLD
+from modules.semantics import column_tags
+
+try:
+    # google-re2: 백트래킹 없는 선형 시간 매칭 (선택 의존성)
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # pyarrow: 연속 UTF-8 버퍼 기반 문자열 및 C++ 정규식 커널 (선택 의존성)
+    import pyarrow  # noqa: F401
+    _ARROW_STRING = pd.StringDtype('pyarrow')
+except ImportError:
+    _ARROW_STRING = None
+
+
+# 형식 검사 정규식 (Python re 문법, 모듈 로드 시 한 번만 컴파일)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'^[\d\-\(\)\+\s]+$')
+_HANGUL_JAMO_RE = re.compile(r'[ㄱ-ㅎㅏ-ㅣ]')
+_NO_LETTER_RE = re.compile(r'^[^가-힣a-zA-Z]+$')
+
+# RE2 문자 클래스용 공백 문자 (Python \s와 같은 str.isspace() 문자 집합)
+_RE2_SPACE = r'\t-\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}'
+
+# 컬럼 규칙 결과 캐시: (규칙, 컬럼명, 타입, 값 타입, 컬럼 내용 해시) -> 이슈
+# 지표별 전용 워커 프로세스(runner)에 유지되며 재진단 시 내용이 바뀌지 않은 컬럼은 다시 검사하지 않음
+_RULE_CACHE_SIZE = 512
+_rule_cache = OrderedDict()
+_rule_cache_lock = threading.Lock()
+
+# 이슈 상세 정보에서 컬럼명을 담는 키
+_ISSUE_COLUMN_KEYS = ('column', 'start_column', 'end_column', 'date_column', 'reason_column')
+
+# 여부(Y/N) 컬럼 허용값
+_YN_VALID_VALUES = {'Y', 'N', 'y', 'n', '1', '0', 'true', 'false', 'True', 'False'}
+
+
+def _text_values(series):
+    """NULL을 제외한 값을 문자열 Series로 변환 (pyarrow 사용 가능 시 Arrow 문자열)"""
+    return series.dropna().astype(_ARROW_STRING if _ARROW_STRING is not None else str)
+
+
+def _re2_source(source):
+    """
+    Python re 문법 패턴을 같은 문자열을 매칭하는 RE2 문법으로 변환
+
+    RE2의 \d, \s는 ASCII 전용이고 $는 끝 개행을 허용하지 않으므로
+    유니코드 클래스와 \n?$로 바꿉니다. (\s는 문자 클래스 안에서만 사용)
+    """
+    source = source.replace(r'\d', r'\p{Nd}').replace(r'\s', _RE2_SPACE)
+    if source.endswith('$'):
+        source = source[:-1] + r'\n?$'
+    return source
+
+
+# google-re2 매칭용 패턴: Python re 패턴 문자열 -> RE2 문법으로 변환해 컴파일한 패턴
+_RE2_PATTERNS = {
+    pattern.pattern: re2.compile(_re2_source(pattern.pattern))
+    for pattern in (_EMAIL_RE, _PHONE_RE, _HANGUL_JAMO_RE, _NO_LETTER_RE)
+} if re2 is not None else {}
+
+
+def _regex_mask(values, pattern, search=False):
+    """
+    문자열 Series에 컴파일된 정규식을 적용한 불리언 마스크 반환
+
+    Arrow 문자열은 RE2 문법으로 변환한 패턴을 pyarrow의 벡터화 정규식 커널로 매칭하고,
+    그 외에는 google-re2 사용 가능 시 변환된 RE2 패턴, 아니면 re 패턴으로 직접 매칭합니다.
+    (pandas str 메서드는 object 문자열의 패턴을 표준 re로 다시 컴파일함)
+    """
+    if isinstance(values.dtype, pd.StringDtype):
+        method = values.str.contains if search else values.str.match
+        return pd.Series(method(_re2_source(pattern.pattern)).to_numpy(dtype=bool, na_value=False), index=values.index)
+
+    pattern = _RE2_PATTERNS.get(pattern.pattern, pattern)
+    matcher = pattern.search if search else pattern.match
+    arr = values.to_numpy(dtype=object)
+    mask = np.fromiter((matcher(v) is not None for v in arr), dtype=bool, count=arr.size)
+    return pd.Series(mask, index=values.index)
+
+
+def _column_digest(series):
+    """컬럼 내용 해시 (값과 순서 기준, 인덱스 제외)"""
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def _issue_columns(issues):
+    """이슈가 참조하는 컬럼명 집합"""
+    columns = set()
+    for issue in issues:
+        for key in _ISSUE_COLUMN_KEYS:
+            if key in issue['details']:
+                columns.add(issue['details'][key])
+    return columns
 
 
 class AccuracyChecker:
-    def __init__(self, df):
+    def __init__(self, df, tags=None, fast_mode=False, sample_threshold=SAMPLE_THRESHOLD):
         self.df = df
         self.name = "정확성 (Accuracy)"
+        # 컬럼 의미 태그 (미지정 시 컬럼명으로 분류)
+        self._tags = tags if tags is not None else column_tags(df)
+        # 빠른 모드: 임계치를 초과하는 대용량 데이터는 표본으로 1차 검사
+        self._sample = None
+        if fast_mode and len(df) > sample_threshold:
+            self._sample = df.sample(sample_threshold, random_state=0)
+        # 컬럼 내용 해시 (규칙 결과 캐시 키)
+        self._digests = {}
+        # 컬럼별 non-null 개수 (값이 모두 NULL인 컬럼은 검사 대상에서 제외)
+        self._nonnull_counts = df.count()
+        checkable_cols = [col for col in df.columns if self._nonnull_counts[col] > 0]
+        # 타입 분류는 한 번만 수행
+        self._numeric_cols = [col for col in checkable_cols if pd.api.types.is_numeric_dtype(df[col])]
+        self._object_cols = [col for col in checkable_cols if df[col].dtype == 'object']
 
     def check(self):
         """정확성 진단 실행"""
-        issues = []
         metrics = {}
 
-        # 1. 도메인 정확성 검사
-        domain_issues = self._check_domain_accuracy()
-        issues.extend(domain_issues)
+        if self._sample is None:
+            issues = self._run_checks()
+        else:
+            # 1차: 표본에서 이슈가 발견된 컬럼 선별
+            sample_issues = AccuracyChecker(self._sample, tags=self._tags)._run_checks()
+            flagged = _issue_columns(sample_issues)
 
-        # 2. 범위 정확성 검사
-        range_issues = self._check_range_accuracy()
-        issues.extend(range_issues)
-
-        # 3. 형식 정확성 검사
-        format_issues = self._check_format_accuracy()
-        issues.extend(format_issues)
-
-        # 4. 날짜 유효성 검사
-        date_issues = self._check_date_validity()
-        issues.extend(date_issues)
-
-        # 5. 논리적 일관성 검사
-        logic_issues = self._check_logical_consistency()
-        issues.extend(logic_issues)
+            # 2차: 선별된 컬럼만 전체 데이터로 정밀 검사
+            flagged_cols = [col for col in self.df.columns if col in flagged]
+            issues = AccuracyChecker(self.df[flagged_cols], tags=self._tags)._run_checks() if flagged_cols else []
 
         # 메트릭 계산
         total_values = len(self.df) * len(self.df.columns)
-        invalid_count = sum([issue['details'].get('error_count', 0) for issue in issues])
+        invalid_count = sum(issue['details'].get('error_count', 0) for issue in issues)
 
         accuracy_rate = ((total_values - invalid_count) / total_values * 100) if total_values > 0 else 0
 
@@ -58,22 +165,53 @@ class AccuracyChecker:
             'name': self.name,
             'score': score,
             'issues': issues,
+            'severity_counts': count_severities(issues),
             'metrics': metrics
         }
 
+    def _run_checks(self):
+        """전체 정확성 검사 항목 실행"""
+        issues = []
+
+        # 1. 도메인 정확성 검사
+        domain_issues = self._check_domain_accuracy()
+        issues.extend(domain_issues)
+
+        # 2. 범위 정확성 검사
+        range_issues = self._check_range_accuracy()
+        issues.extend(range_issues)
+
+        # 3. 형식 정확성 검사
+        format_issues = self._check_format_accuracy()
+        issues.extend(format_issues)
+
+        # 4. 날짜 유효성 검사
+        date_issues = self._check_date_validity()
+        issues.extend(date_issues)
+
+        # 5. 논리적 일관성 검사
+        logic_issues = self._check_logical_consistency()
+        issues.extend(logic_issues)
+
+        return issues
+
     def _check_domain_accuracy(self):
         """도메인(여부, 코드 등) 정확성 검사"""
         issues = []
 
         for col in self.df.columns:
             # Y/N 여부 컬럼 검사
-            if any(keyword in col.lower() for keyword in ['yn', '여부', '유무']):
-                valid_values = {'Y', 'N', 'y', 'n', '1', '0', 'true', 'false', 'True', 'False'}
-                invalid_mask = ~self.df[col].isin(valid_values) & self.df[col].notna()
-                invalid_count = invalid_mask.sum()
+            if self._tags[col]['is_yn'] and self._nonnull_counts[col] > 0:
+                valid_values = _YN_VALID_VALUES
+
+                # 고유값 단위로 유효성 판정 후 정수 코드로 행 단위 확장 (NULL은 코드 -1)
+                codes, uniques = pd.factorize(self.df[col])
+                invalid_uniques = ~pd.Index(uniques).isin(list(valid_values))
+                invalid_mask = (codes >= 0) & invalid_uniques[codes]
+                invalid_count = np.count_nonzero(invalid_mask)
 
                 if invalid_count > 0:
-                    invalid_values = self.df.loc[invalid_mask, col].unique()
+                    invalid_values = uniques[invalid_uniques]
 
                     issues.append({
                         'title': f'컬럼 "{col}"의 여부 도메인 오류',
@@ -93,246 +231,311 @@ class AccuracyChecker:
         """범위 정확성 검사"""
         issues = []
 
-        for col in self.df.columns:
-            # 숫자형 컬럼만 검사
-            if pd.api.types.is_numeric_dtype(self.df[col]):
-
-                # 음수가 있으면 안되는 컬럼
-                if any(keyword in col.lower() for keyword in ['수량', '건수', '횟수', 'count', 'quantity', '나이', 'age']):
-                    negative_count = (self.df[col] < 0).sum()
-
-                    if negative_count > 0:
-                        issues.append({
-                            'title': f'컬럼 "{col}"에 음수 값 존재',
-                            'severity': '🔴 높음',
-                            'description': f'수량/건수 컬럼에 음수 값이 {negative_count}건 발견되었습니다.',
-                            'details': {
-                                'column': col,
-                                'error_count': int(negative_count),
-                                'min_value': float(self.df[col].min())
-                            }
-                        })
-
-                # 퍼센트/비율 컬럼 (0-100 또는 0-1 범위)
-                if any(keyword in col.lower() for keyword in ['율', 'rate', 'ratio', 'percent', '%']):
-                    out_of_range = ((self.df[col] < 0) | (self.df[col] > 100)).sum()
-
-                    if out_of_range > 0:
-                        issues.append({
-                            'title': f'컬럼 "{col}"의 범위 오류',
-                            'severity': '🔴 높음',
-                            'description': f'비율 값이 유효 범위(0-100)를 벗어난 데이터가 {out_of_range}건 발견되었습니다.',
-                            'details': {
-                                'column': col,
-                                'error_count': int(out_of_range),
-                                'min_value': float(self.df[col].min()),
-                                'max_value': float(self.df[col].max())
-                            }
-                        })
-
-                # 나이 컬럼 (0-150 범위)
-                if any(keyword in col.lower() for keyword in ['나이', 'age']):
-                    out_of_range = ((self.df[col] < 0) | (self.df[col] > 150)).sum()
-
-                    if out_of_range > 0:
-                        issues.append({
-                            'title': f'컬럼 "{col}"의 나이 범위 오류',
-                            'severity': '🔴 높음',
-                            'description': f'나이 값이 유효 범위(0-150)를 벗어난 데이터가 {out_of_range}건 발견되었습니다.',
-                            'details': {
-                                'column': col,
-                                'error_count': int(out_of_range),
-                                'min_value': float(self.df[col].min()),
-                                'max_value': float(self.df[col].max())
-                            }
-                        })
-
-                # 연도 컬럼 범위 검사
-                if any(keyword in col.lower() for keyword in ['년도', 'year', '연도', 'join_year', 'birth_year', '가입년도', '생년']):
-                    from datetime import datetime
-                    current_year = datetime.now().year
-
-                    # 컬럼 종류에 따라 다른 범위 적용
-                    if any(keyword in col.lower() for keyword in ['birth', '생년', '출생']):
-                        # 출생 연도: 1900 ~ 현재
-                        min_year, max_year = 1900, current_year
-                        range_desc = f'{min_year}-{max_year}'
-                    elif any(keyword in col.lower() for keyword in ['join', '가입', '등록', 'register']):
-                        # 가입 연도: 최근 10년 ~ 현재 (그 이전은 너무 오래됨)
-                        min_year, max_year = current_year - 10, current_year
-                        range_desc = f'{min_year}-{max_year} (최근 10년)'
-                    else:
-                        # 일반 연도: 1900 ~ 현재+1
-                        min_year, max_year = 1900, current_year + 1
-                        range_desc = f'{min_year}-{max_year}'
-
-                    out_of_range = ((self.df[col] < min_year) | (self.df[col] > max_year)).sum()
-
-                    if out_of_range > 0:
-                        # 과거/미래 분리
-                        too_old = (self.df[col] < min_year).sum()
-                        too_new = (self.df[col] > max_year).sum()
-
-                        detail_msg = []
-                        if too_old > 0:
-                            detail_msg.append(f'과거 연도 {too_old}건')
-                        if too_new > 0:
-                            detail_msg.append(f'미래 연도 {too_new}건')
-
-                        issues.append({
-                            'title': f'컬럼 "{col}"의 연도 범위 오류',
-                            'severity': '🔴 높음',
-                            'description': f'연도 값이 유효 범위({range_desc})를 벗어난 데이터가 {out_of_range}건 발견되었습니다. ({", ".join(detail_msg)})',
-                            'details': {
-                                'column': col,
-                                'error_count': int(out_of_range),
-                                'too_old_count': int(too_old),
-                                'too_new_count': int(too_new),
-                                'min_value': float(self.df[col].min()),
-                                'max_value': float(self.df[col].max()),
-                                'valid_range': range_desc
-                            }
-                        })
+        # 숫자형 컬럼만 검사
+        for col in self._numeric_cols:
+            tags = self._tags[col]
 
-        return issues
+            check_negative = tags['is_non_negative']
+            check_rate = tags['is_rate']
+            check_age = tags['is_age']
+            check_year = tags['is_year']
 
-    def _check_format_accuracy(self):
-        """형식 정확성 검사"""
-        issues = []
+            if not (check_negative or check_rate or check_age or check_year):
+                continue
 
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object':
-                # 한글 문자 유효성 검사
-                if any(keyword in col.lower() for keyword in ['이름', 'name', '성명', '직위', '부서', '명칭']):
-                    non_null = self.df[col].dropna()
-
-                    if len(non_null) > 0:
-                        # 비완성형 한글, 특수문자 혼입 검사
-                        import re
-                        invalid_korean = []
-
-                        for val in non_null:
-                            val_str = str(val).strip()
-                            if not val_str:
-                                continue
-
-                            # 비완성형 한글 검사 (ㄱ-ㅎ, ㅏ-ㅣ 단독)
-                            if re.search(r'[ㄱ-ㅎㅏ-ㅣ]', val_str):
-                                invalid_korean.append(val_str)
-                            # 유효하지 않은 문자열 패턴 (숫자만, 특수문자만 등)
-                            elif re.match(r'^[^가-힣a-zA-Z]+$', val_str) and not val_str.isdigit():
-                                invalid_korean.append(val_str)
-
-                        if invalid_korean:
-                            invalid_count = len(invalid_korean)
-                            issues.append({
-                                'title': f'컬럼 "{col}"의 한글 문자 유효성 오류',
-                                'severity': '🔴 높음',
-                                'description': f'비완성형 한글이나 유효하지 않은 문자열이 {invalid_count}건 발견되었습니다.',
-                                'details': {
-                                    'column': col,
-                                    'error_count': invalid_count,
-                                    'examples': list(set(invalid_korean))[:10]
-                                }
-                            })
+            # 컬럼 값은 한 번만 배열로 가져와 모든 범위 규칙에 재사용
+            # (NULL이 없는 NumPy 정수형은 float64로 복사하지 않고 원본 버퍼를 그대로 검사)
+            dtype = self.df[col].dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+                arr = self.df[col].to_numpy()
+            else:
+                arr = self.df[col].to_numpy(dtype=np.float64, na_value=np.nan)
 
-                # 이메일 형식 검사
-                if any(keyword in col.lower() for keyword in ['email', '이메일', 'mail']):
-                    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                    non_null = self.df[col].dropna()
+            # 음수가 있으면 안되는 컬럼
+            if check_negative:
+                negative_count, min_value, _ = scan_range(arr, 0.0, np.inf)
 
-                    if len(non_null) > 0:
-                        invalid_mask = ~non_null.astype(str).str.match(email_pattern)
-                        invalid_count = invalid_mask.sum()
+                if negative_count > 0:
+                    issues.append({
+                        'title': f'컬럼 "{col}"에 음수 값 존재',
+                        'severity': '🔴 높음',
+                        'description': f'수량/건수 컬럼에 음수 값이 {negative_count}건 발견되었습니다.',
+                        'details': {
+                            'column': col,
+                            'error_count': int(negative_count),
+                            'min_value': min_value
+                        }
+                    })
 
-                        if invalid_count > 0:
-                            issues.append({
-                                'title': f'컬럼 "{col}"의 이메일 형식 오류',
-                                'severity': '🟡 중간',
-                                'description': f'유효하지 않은 이메일 형식이 {invalid_count}건 발견되었습니다.',
-                                'details': {
-                                    'column': col,
-                                    'error_count': int(invalid_count),
-                                    'examples': list(non_null[invalid_mask].head(5))
-                                }
-                            })
+            # 퍼센트/비율 컬럼 (0-100 또는 0-1 범위)
+            if check_rate:
+                out_of_range, min_value, max_value = scan_range(arr, 0.0, 100.0)
 
-                # 전화번호 형식 검사
-                if any(keyword in col.lower() for keyword in ['phone', 'tel', '전화', '연락처', '휴대폰']):
-                    phone_pattern = r'^[\d\-\(\)\+\s]+$'
-                    non_null = self.df[col].dropna()
+                if out_of_range > 0:
+                    issues.append({
+                        'title': f'컬럼 "{col}"의 범위 오류',
+                        'severity': '🔴 높음',
+                        'description': f'비율 값이 유효 범위(0-100)를 벗어난 데이터가 {out_of_range}건 발견되었습니다.',
+                        'details': {
+                            'column': col,
+                            'error_count': int(out_of_range),
+                            'min_value': min_value,
+                            'max_value': max_value
+                        }
+                    })
 
-                    if len(non_null) > 0:
-                        invalid_mask = ~non_null.astype(str).str.match(phone_pattern)
-                        invalid_count = invalid_mask.sum()
+            # 나이 컬럼 (0-150 범위)
+            if check_age:
+                out_of_range, min_value, max_value = scan_range(arr, 0.0, 150.0)
 
-                        if invalid_count > 0:
-                            issues.append({
-                                'title': f'컬럼 "{col}"의 전화번호 형식 오류',
-                                'severity': '🟡 중간',
-                                'description': f'유효하지 않은 전화번호 형식이 {invalid_count}건 발견되었습니다.',
-                                'details': {
-                                    'column': col,
-                                    'error_count': int(invalid_count),
-                                    'examples': list(non_null[invalid_mask].head(5))
-                                }
-                            })
+                if out_of_range > 0:
+                    issues.append({
+                        'title': f'컬럼 "{col}"의 나이 범위 오류',
+                        'severity': '🔴 높음',
+                        'description': f'나이 값이 유효 범위(0-150)를 벗어난 데이터가 {out_of_range}건 발견되었습니다.',
+                        'details': {
+                            'column': col,
+                            'error_count': int(out_of_range),
+                            'min_value': min_value,
+                            'max_value': max_value
+                        }
+                    })
+
+            # 연도 컬럼 범위 검사
+            if check_year:
+                current_year = datetime.now().year
+
+                # 컬럼 종류에 따라 다른 범위 적용
+                if tags['is_year_birth']:
+                    # 출생 연도: 1900 ~ 현재
+                    min_year, max_year = 1900, current_year
+                    range_desc = f'{min_year}-{max_year}'
+                elif tags['is_year_join']:
+                    # 가입 연도: 최근 10년 ~ 현재 (그 이전은 너무 오래됨)
+                    min_year, max_year = current_year - 10, current_year
+                    range_desc = f'{min_year}-{max_year} (최근 10년)'
+                else:
+                    # 일반 연도: 1900 ~ 현재+1
+                    min_year, max_year = 1900, current_year + 1
+                    range_desc = f'{min_year}-{max_year}'
+
+                # 과거/미래 분리 (두 범위는 겹치지 않으므로 전체 범위 오류 수에서 과거 연도 수를 빼면 미래 연도 수)
+                out_of_range, min_value, max_value = scan_range(arr, min_year, max_year)
+                too_old = count_out_of_range(arr, min_year, np.inf) if out_of_range > 0 else 0
+                too_new = out_of_range - too_old
+
+                if out_of_range > 0:
+                    detail_msg = []
+                    if too_old > 0:
+                        detail_msg.append(f'과거 연도 {too_old}건')
+                    if too_new > 0:
+                        detail_msg.append(f'미래 연도 {too_new}건')
+
+                    issues.append({
+                        'title': f'컬럼 "{col}"의 연도 범위 오류',
+                        'severity': '🔴 높음',
+                        'description': f'연도 값이 유효 범위({range_desc})를 벗어난 데이터가 {out_of_range}건 발견되었습니다. ({", ".join(detail_msg)})',
+                        'details': {
+                            'column': col,
+                            'error_count': int(out_of_range),
+                            'too_old_count': int(too_old),
+                            'too_new_count': int(too_new),
+                            'min_value': min_value,
+                            'max_value': max_value,
+                            'valid_range': range_desc
+                        }
+                    })
 
         return issues
 
+    def _cached_rule(self, rule, col):
+        """컬럼 단위 규칙 실행 (같은 이름과 내용의 컬럼은 이전 결과 재사용)"""
+        if col not in self._digests:
+            series = self.df[col]
+            # object 값은 문자열 표현으로 해시되므로 값 타입이 섞인 컬럼(1과 '1' 구분 불가)은 캐시하지 않음
+            kind = pd.api.types.infer_dtype(series, skipna=True)
+            self._digests[col] = None if kind.startswith('mixed') else (str(series.dtype), kind, _column_digest(series))
+        if self._digests[col] is None:
+            return rule(col)
+        key = (rule.__name__, col, self._digests[col])
+
+        # 캐시된 이슈는 호출자가 수정해도 영향이 없도록 복사본으로 저장/반환
+        with _rule_cache_lock:
+            if key in _rule_cache:
+                _rule_cache.move_to_end(key)
+                return copy.deepcopy(_rule_cache[key])
+
+        issue = rule(col)
+
+        with _rule_cache_lock:
+            _rule_cache[key] = copy.deepcopy(issue)
+            # 가장 오래 사용되지 않은 결과부터 제거
+            while len(_rule_cache) > _RULE_CACHE_SIZE:
+                _rule_cache.popitem(last=False)
+
+        return issue
+
+    def _check_format_accuracy(self):
+        """형식 정확성 검사"""
+        # (컬럼, 규칙) 단위 검사 목록
+        tasks = []
+        for col in self._object_cols:
+            tags = self._tags[col]
+            if tags['is_name']:
+                tasks.append((self._check_korean_format, col))
+            if tags['is_email']:
+                tasks.append((self._check_email_format, col))
+            if tags['is_phone']:
+                tasks.append((self._check_phone_format, col))
+
+        # 컬럼별 정규식 검사는 서로 독립적이므로 스레드로 동시 실행 (결과는 목록 순서 유지)
+        if len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+                results = list(executor.map(lambda task: self._cached_rule(*task), tasks))
+        else:
+            results = [self._cached_rule(rule, col) for rule, col in tasks]
+
+        return [issue for issue in results if issue is not None]
+
+    def _check_korean_format(self, col):
+        """한글 문자 유효성 검사"""
+        values = _text_values(self.df[col])
+
+        if len(values) > 0:
+            # 비완성형 한글, 특수문자 혼입 검사
+            values = values.str.strip()
+
+            # 비완성형 한글 검사 (ㄱ-ㅎ, ㅏ-ㅣ 단독)
+            incomplete_mask = _regex_mask(values, _HANGUL_JAMO_RE, search=True)
+            # 유효하지 않은 문자열 패턴 (숫자만, 특수문자만 등)
+            pattern_mask = _regex_mask(values, _NO_LETTER_RE) & ~values.str.isdigit().astype(bool)
+
+            invalid_korean = values[incomplete_mask | pattern_mask]
+
+            if len(invalid_korean) > 0:
+                invalid_count = len(invalid_korean)
+                return {
+                    'title': f'컬럼 "{col}"의 한글 문자 유효성 오류',
+                    'severity': '🔴 높음',
+                    'description': f'비완성형 한글이나 유효하지 않은 문자열이 {invalid_count}건 발견되었습니다.',
+                    'details': {
+                        'column': col,
+                        'error_count': invalid_count,
+                        'examples': invalid_korean.unique()[:10].tolist()
+                    }
+                }
+        return None
+
+    def _check_email_format(self, col):
+        """이메일 형식 검사"""
+        non_null = self.df[col].dropna()
+
+        if len(non_null) > 0:
+            invalid_mask = ~_regex_mask(_text_values(non_null), _EMAIL_RE)
+            invalid_count = invalid_mask.sum()
+
+            if invalid_count > 0:
+                return {
+                    'title': f'컬럼 "{col}"의 이메일 형식 오류',
+                    'severity': '🟡 중간',
+                    'description': f'유효하지 않은 이메일 형식이 {invalid_count}건 발견되었습니다.',
+                    'details': {
+                        'column': col,
+                        'error_count': int(invalid_count),
+                        'examples': list(non_null[invalid_mask].head(5))
+                    }
+                }
+        return None
+
+    def _check_phone_format(self, col):
+        """전화번호 형식 검사"""
+        non_null = self.df[col].dropna()
+
+        if len(non_null) > 0:
+            invalid_mask = ~_regex_mask(_text_values(non_null), _PHONE_RE)
+            invalid_count = invalid_mask.sum()
+
+            if invalid_count > 0:
+                return {
+                    'title': f'컬럼 "{col}"의 전화번호 형식 오류',
+                    'severity': '🟡 중간',
+                    'description': f'유효하지 않은 전화번호 형식이 {invalid_count}건 발견되었습니다.',
+                    'details': {
+                        'column': col,
+                        'error_count': int(invalid_count),
+                        'examples': list(non_null[invalid_mask].head(5))
+                    }
+                }
+        return None
+
     def _check_date_validity(self):
         """날짜 유효성 검사"""
         issues = []
 
-        for col in self.df.columns:
+        for col in self._object_cols:
             # 날짜 컬럼으로 추정되는 경우
-            if any(keyword in col.lower() for keyword in ['date', 'dt', '일자', '날짜']):
-
-                if self.df[col].dtype == 'object':
-                    non_null = self.df[col].dropna()
-
-                    if len(non_null) > 0:
-                        invalid_dates = []
-
-                        for val in non_null:
-                            try:
-                                # 다양한 형식으로 파싱 시도
-                                pd.to_datetime(val)
-                            except:
-                                invalid_dates.append(val)
-
-                        if invalid_dates:
-                            issues.append({
-                                'title': f'컬럼 "{col}"의 날짜 유효성 오류',
-                                'severity': '🔴 높음',
-                                'description': f'유효하지 않은 날짜 값이 {len(invalid_dates)}건 발견되었습니다.',
-                                'details': {
-                                    'column': col,
-                                    'error_count': len(invalid_dates),
-                                    'examples': invalid_dates[:10]
-                                }
-                            })
+            if self._tags[col]['is_date']:
+                issue = self._cached_rule(self._check_date_format, col)
+                if issue is not None:
+                    issues.append(issue)
 
         return issues
 
+    def _check_date_format(self, col):
+        """날짜 값 파싱 가능 여부 검사"""
+        non_null = self.df[col].dropna()
+
+        if len(non_null) > 0:
+            # 값마다 형식을 추론하여 일괄 파싱 (파싱 실패 시 NaT)
+            parsed = pd.to_datetime(non_null, errors='coerce', format='mixed')
+            invalid_mask = parsed.isna()
+            invalid_count = int(invalid_mask.sum())
+
+            if invalid_count > 0:
+                return {
+                    'title': f'컬럼 "{col}"의 날짜 유효성 오류',
+                    'severity': '🔴 높음',
+                    'description': f'유효하지 않은 날짜 값이 {invalid_count}건 발견되었습니다.',
+                    'details': {
+                        'column': col,
+                        'error_count': invalid_count,
+                        'examples': non_null[invalid_mask].head(10).tolist()
+                    }
+                }
+        return None
+
     def _check_logical_consistency(self):
         """논리적 일관성 검사"""
         issues = []
 
         # 시작일 < 종료일 검사
-        start_cols = [col for col in self.df.columns if any(keyword in col.lower() for keyword in ['시작', 'start', 'from', '등록', '착공'])]
-        end_cols = [col for col in self.df.columns if any(keyword in col.lower() for keyword in ['종료', 'end', 'to', '완료', '준공'])]
+        start_cols = [col for col in self.df.columns if self._tags[col]['is_start']]
+        end_cols = [col for col in self.df.columns if self._tags[col]['is_end']]
+
+        # 컬럼별 날짜 변환은 한 번만 수행
+        parsed_dates = {}
+        for col in set(start_cols) | set(end_cols):
+            if self._nonnull_counts[col] == 0:
+                continue
+            try:
+                parsed_dates[col] = pd.to_datetime(self.df[col], errors='coerce')
+            except:
+                pass
 
         for start_col in start_cols:
             for end_col in end_cols:
                 try:
-                    start_dates = pd.to_datetime(self.df[start_col], errors='coerce')
-                    end_dates = pd.to_datetime(self.df[end_col], errors='coerce')
+                    start_dates = parsed_dates[start_col]
+                    end_dates = parsed_dates[end_col]
 
                     # 둘 다 날짜로 변환 가능한 경우
                     if start_dates.notna().any() and end_dates.notna().any():
-                        invalid_mask = (start_dates > end_dates) & start_dates.notna() & end_dates.notna()
-                        invalid_count = invalid_mask.sum()
+                        # 같은 해상도의 datetime64 컬럼은 정수 뷰로 한 번에 비교
+                        if pd.api.types.is_datetime64_dtype(start_dates) and start_dates.dtype == end_dates.dtype:
+                            invalid_count = count_later(start_dates, end_dates)
+                        else:
+                            invalid_mask = (start_dates > end_dates) & start_dates.notna() & end_dates.notna()
+                            invalid_count = invalid_mask.sum()
 
                         if invalid_count > 0:
                             issues.append({
@@ -350,8 +553,8 @@ class AccuracyChecker:
 
         # 컬럼 간 논리관계 검사 (종속 관계)
         # 폐기일자가 있으면 폐기사유도 있어야 함
-        discard_date_cols = [col for col in self.df.columns if any(keyword in col.lower() for keyword in ['폐기일', '삭제일', 'delete_date'])]
-        discard_reason_cols = [col for col in self.df.columns if any(keyword in col.lower() for keyword in ['폐기사유', '폐기이유', '삭제사유', 'delete_reason'])]
+        discard_date_cols = [col for col in self.df.columns if self._tags[col]['is_discard_date']]
+        discard_reason_cols = [col for col in self.df.columns if self._tags[col]['is_discard_reason']]
 
         for date_col in discard_date_cols:
             for reason_col in discard_reason_cols:
@@ -5,15 +5,54 @@ Completeness Checker Module
 데이터 모델의 완전성, 식별자, 물리구조, 속성의미 등을 진단합니다.
 """
 
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-from modules.utils import safe_outlier_detection, calculate_uniqueness_metrics
+from modules.utils import calculate_uniqueness_metrics, count_severities, stride_sample, SAMPLE_THRESHOLD
+
+try:
+    # pyarrow: C++ 문자열 커널 기반 공백 검사 (선택 의존성)
+    import pyarrow  # noqa: F401
+    _ARROW_STRING = pd.StringDtype('pyarrow')
+except ImportError:
+    _ARROW_STRING = None
+
+
+# 숫자 변환 가능 여부를 먼저 확인할 앞부분 값 개수
+_TYPE_PROBE_SIZE = 1000
+
+# 변환 없이 숫자로 판정하는 infer_dtype 결과
+_NUMERIC_KINDS = {'integer', 'floating', 'mixed-integer-float', 'decimal'}
+
+
+def _count_blank(series):
+    """빈 문자열 또는 공백만 있는 문자열 개수 (NULL 제외)"""
+    if _ARROW_STRING is not None:
+        # Arrow 문자열은 NULL 비교 결과가 NA이므로 합계에서 자동 제외
+        return int((series.astype(_ARROW_STRING).str.strip() == '').sum())
+    blank_mask = (series.fillna('').str.strip() == '').to_numpy()
+    return int(np.count_nonzero(blank_mask) - np.count_nonzero(series.isnull().to_numpy()))
 
 
 class CompletenessChecker:
-    def __init__(self, df):
+    # 메트릭 표시 형식 (메트릭은 숫자로 반환하고 화면 표시 시점에 형식 적용)
+    METRIC_FORMATS = {
+        '완전성 비율': '{:.2f}%',
+        'NULL 셀 수': '{:,}',
+        '전체 셀 수': '{:,}',
+    }
+
+    def __init__(self, df, fast_mode=False, sample_threshold=SAMPLE_THRESHOLD):
         self.df = df
         self.name = "완전성 (Completeness)"
+        # 빠른 모드: 타입 추론은 임계치 크기의 균등 간격 표본으로 수행
+        self._sample_limit = sample_threshold if fast_mode else None
+        # 컬럼별 메타 정보는 한 번만 계산하여 모든 검사에서 재사용
+        self._dtypes = df.dtypes.to_dict()
+        self._null_counts = df.isnull().sum()
+        self._nunique = df.nunique()
 
     def check(self):
         """완전성 진단 실행"""
@@ -45,12 +84,12 @@ class CompletenessChecker:
 
         # 메트릭 계산
         total_cells = len(self.df) * len(self.df.columns)
-        null_cells = self.df.isnull().sum().sum()
+        null_cells = int(self._null_counts.sum())
         completeness_rate = ((total_cells - null_cells) / total_cells * 100) if total_cells > 0 else 0
 
-        metrics['완전성 비율'] = f"{completeness_rate:.2f}%"
-        metrics['NULL 셀 수'] = f"{null_cells:,}"
-        metrics['전체 셀 수'] = f"{total_cells:,}"
+        metrics['완전성 비율'] = completeness_rate
+        metrics['NULL 셀 수'] = null_cells
+        metrics['전체 셀 수'] = total_cells
 
         # 점수 계산 (100점 만점)
         score = self._calculate_score(completeness_rate, len(issues))
@@ -59,15 +98,17 @@ class CompletenessChecker:
             'name': self.name,
             'score': score,
             'issues': issues,
+            'severity_counts': count_severities(issues),
             'metrics': metrics
         }
 
     def _check_primary_key(self):
         """기본키 존재 여부 확인"""
-        # 모든 행이 유일한지 확인
-        duplicate_rows = self.df.duplicated().sum()
+        # 모든 행이 유일한지 확인 (중복이 없으면 개수 집계 생략)
+        duplicate_mask = self.df.duplicated().to_numpy()
 
-        if duplicate_rows > 0:
+        if duplicate_mask.any():
+            duplicate_rows = np.count_nonzero(duplicate_mask)
             return {
                 'title': '기본키 미정의 또는 중복 레코드',
                 'severity': '🔴 높음',
@@ -83,17 +124,24 @@ class CompletenessChecker:
         """NULL 값 및 공백 값 검사"""
         issues = []
 
-        null_summary = self.df.isnull().sum()
-        null_cols = null_summary[null_summary > 0]
+        null_cols = self._null_counts[self._null_counts > 0]
+
+        # 빈 문자열, 공백만 있는 문자열 개수 (NULL이 있는 문자열 컬럼만 계산)
+        object_cols = [col for col in null_cols.index if self._dtypes[col] == 'object']
+        # 컬럼별 공백 검사는 서로 독립적이고 Arrow 문자열 커널은 GIL을 해제하므로 스레드로 동시 실행
+        if len(object_cols) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(object_cols), os.cpu_count() or 1)) as executor:
+                space_counts = dict(zip(object_cols, executor.map(lambda col: _count_blank(self.df[col]), object_cols)))
+        else:
+            space_counts = {col: _count_blank(self.df[col]) for col in object_cols}
 
         for col, null_count in null_cols.items():
             null_rate = (null_count / len(self.df)) * 100
 
             # NULL과 Space 혼재 검사 (문자열 컬럼만)
             space_count = 0
-            if self.df[col].dtype == 'object':
-                # 빈 문자열, 공백만 있는 문자열 검사
-                space_count = (self.df[col].fillna('').str.strip() == '').sum() - null_count
+            if col in space_counts:
+                space_count = space_counts[col]
 
                 # NULL과 Space가 모두 존재하면 혼재 경고
                 if null_count > 0 and space_count > 0:
@@ -152,15 +200,8 @@ class CompletenessChecker:
 
     def _check_unused_columns(self):
         """미사용 컬럼 검사"""
-        unused_cols = []
-
-        for col in self.df.columns:
-            # 모든 값이 NULL인 컬럼
-            if self.df[col].isnull().all():
-                unused_cols.append(col)
-            # 모든 값이 동일한 컬럼
-            elif self.df[col].nunique() <= 1:
-                unused_cols.append(col)
+        # 모든 값이 NULL인 컬럼(고유값 0개)과 모든 값이 동일한 컬럼(고유값 1개)을 한 번에 판정
+        unused_cols = self._nunique[self._nunique <= 1].index.tolist()
 
         if unused_cols:
             return {
@@ -177,28 +218,39 @@ class CompletenessChecker:
     def _check_data_types(self):
         """데이터 타입 일치성 검사"""
         type_issues = []
+        sampled = self._sample_limit is not None and len(self.df) > self._sample_limit
 
         for col in self.df.columns:
             # 숫자형으로 보이는 컬럼이 문자형인 경우
-            if self.df[col].dtype == 'object':
+            if self._dtypes[col] == 'object':
                 # NULL이 아닌 값들 중 숫자로 변환 가능한지 확인
-                non_null_values = self.df[col].dropna()
+                non_null_values = stride_sample(self.df[col], self._sample_limit).dropna()
                 if len(non_null_values) > 0:
                     try:
-                        pd.to_numeric(non_null_values)
+                        # 앞부분에서 변환이 실패하면 전체를 변환하지 않고 바로 제외 (일반 문자열 컬럼)
+                        pd.to_numeric(non_null_values.iloc[:_TYPE_PROBE_SIZE])
+
+                        # 값 자체가 숫자 객체이면 변환 없이 판정, 숫자 문자열 등은 전체 변환으로 확인
+                        if pd.api.types.infer_dtype(non_null_values, skipna=True) not in _NUMERIC_KINDS:
+                            pd.to_numeric(non_null_values)
                         type_issues.append(col)
-                    except:
+                    except (ValueError, TypeError):
+                        # 숫자로 변환할 수 없는 문자열 또는 객체 값
                         pass
 
         if type_issues:
+            details = {
+                'columns': type_issues,
+                'count': len(type_issues)
+            }
+            if sampled:
+                details['sampled'] = True
+
             return {
                 'title': '데이터 타입 불일치',
                 'severity': '🟡 중간',
                 'description': f'{len(type_issues)}개의 컬럼이 숫자형으로 변환 가능하나 문자형으로 저장되어 있습니다.',
-                'details': {
-                    'columns': type_issues,
-                    'count': len(type_issues)
-                }
+                'details': details
             }
         return None
 
@@ -206,75 +258,103 @@ class CompletenessChecker:
         """이상치 검사 (IQR 방법 + Z-score 방법)"""
         issues = []
 
-        for col in self.df.columns:
-            if pd.api.types.is_numeric_dtype(self.df[col]):
-                # IQR 방법
-                outliers_iqr = safe_outlier_detection(self.df[col])
-
-                # Z-score 방법 (더 민감한 탐지)
-                non_null = self.df[col].dropna()
-                if len(non_null) > 3:
-                    mean_val = non_null.mean()
-                    std_val = non_null.std()
-
-                    if std_val and std_val != 0:
-                        z_scores = ((non_null - mean_val) / std_val).abs()
-                        # 데이터가 작을수록 더 민감하게 (10개 이하면 1.5, 그 이상이면 2.0)
-                        threshold = 1.5 if len(non_null) <= 10 else 2.0
-                        outliers_z = non_null[z_scores > threshold]
-                    else:
-                        outliers_z = pd.Series(dtype=float)
+        # 숫자형 컬럼 목록은 dtype 정보로 한 번만 판별
+        numeric_cols = [col for col, dtype in self._dtypes.items() if pd.api.types.is_numeric_dtype(dtype)]
+
+        # 행이 없으면 검사할 값이 없음 (빈 블록의 분위수는 컬럼 축 형태를 유지하지 않음)
+        if not numeric_cols or len(self.df) == 0:
+            return issues
+
+        # IQR / Z-score 통계는 숫자형 블록 전체에 대해 컬럼 축으로 한 번에 계산
+        block = self.df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(block)
+        counts = valid.sum(axis=0)
+
+        with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+            # 값이 모두 NULL인 컬럼의 빈 구간 경고 무시 (해당 컬럼은 아래에서 제외됨)
+            warnings.simplefilter('ignore', RuntimeWarning)
+            # IQR 방법: Q1 - 1.5*IQR 미만 또는 Q3 + 1.5*IQR 초과
+            q1, q3 = np.nanquantile(block, [0.25, 0.75], axis=0)
+            iqr = q3 - q1
+            lower_bounds = q1 - 1.5 * iqr
+            upper_bounds = q3 + 1.5 * iqr
+
+            # Z-score 방법
+            means = np.nanmean(block, axis=0)
+            stds = np.nanstd(block, axis=0, ddof=1)
+            z_block = np.abs((block - means) / stds)
+
+        for j, col in enumerate(numeric_cols):
+            series = self.df[col]
+
+            # IQR 방법 (값 4개 이상, 모든 값이 같지 않은 경우만 / 불리언은 분위수 대상 아님)
+            outliers_iqr = series.iloc[:0]
+            if counts[j] >= 4 and iqr[j] != 0 and not pd.api.types.is_bool_dtype(self._dtypes[col]):
+                column = block[:, j]
+                outliers_iqr = series[(column < lower_bounds[j]) | (column > upper_bounds[j])]
+
+            # Z-score 방법 (더 민감한 탐지)
+            outliers_z = []
+            if counts[j] > 3:
+                mean_val = means[j]
+                std_val = stds[j]
+
+                if std_val and std_val != 0:
+                    # 데이터가 작을수록 더 민감하게 (10개 이하면 1.5, 그 이상이면 2.0)
+                    threshold = 1.5 if counts[j] <= 10 else 2.0
+                    outlier_mask = z_block[valid[:, j], j] > threshold
+                    if outlier_mask.any():
+                        # 보고용 값은 원래 타입 그대로 사용
+                        outliers_z = series.dropna().to_numpy()[outlier_mask]
+
+            # 두 방법 중 하나라도 탐지되면 보고
+            if isinstance(outliers_iqr, pd.Series) and len(outliers_iqr) > 0:
+                outlier_rate = (len(outliers_iqr) / len(self.df)) * 100
+
+                if outlier_rate > 10:
+                    severity = '🔴 높음'
+                elif outlier_rate > 5:
+                    severity = '🟡 중간'
                 else:
-                    outliers_z = pd.Series(dtype=float)
-
-                # 두 방법 중 하나라도 탐지되면 보고
-                if isinstance(outliers_iqr, pd.Series) and len(outliers_iqr) > 0:
-                    outlier_rate = (len(outliers_iqr) / len(self.df)) * 100
-
-                    if outlier_rate > 10:
-                        severity = '🔴 높음'
-                    elif outlier_rate > 5:
-                        severity = '🟡 중간'
-                    else:
-                        severity = '🟢 낮음'
-
-                    issues.append({
-                        'title': f'컬럼 "{col}"에서 이상치 발견 (IQR 방법)',
-                        'severity': severity,
-                        'description': f'IQR 방법으로 {len(outliers_iqr)}건({outlier_rate:.2f}%)의 이상치가 탐지되었습니다.',
-                        'details': {
-                            'column': col,
-                            'method': 'IQR',
-                            'outlier_count': len(outliers_iqr),
-                            'outlier_rate': round(outlier_rate, 2),
-                            'outlier_values': list(outliers_iqr.head(10))
-                        }
-                    })
-                elif len(outliers_z) > 0:
-                    # IQR로 탐지 안되면 Z-score로 탐지
-                    outlier_rate = (len(outliers_z) / len(self.df)) * 100
-
-                    if outlier_rate > 10:
-                        severity = '🔴 높음'
-                    elif outlier_rate > 5:
-                        severity = '🟡 중간'
-                    else:
-                        severity = '🟢 낮음'
-
-                    issues.append({
-                        'title': f'컬럼 "{col}"에서 이상치 발견 (Z-score 방법)',
-                        'severity': severity,
-                        'description': f'Z-score 방법으로 {len(outliers_z)}건({outlier_rate:.2f}%)의 이상치가 탐지되었습니다. (평균: {mean_val:.1f}, 표준편차: {std_val:.1f})',
-                        'details': {
-                            'column': col,
-                            'method': 'Z-score',
-                            'outlier_count': len(outliers_z),
-                            'outlier_rate': round(outlier_rate, 2),
-                            'outlier_values': list(outliers_z.head(10)),
-                            'mean': round(mean_val, 2),
-                            'std': round(std_val, 2)
-                        }
-                    })
+                    severity = '🟢 낮음'
+
+                issues.append({
+                    'title': f'컬럼 "{col}"에서 이상치 발견 (IQR 방법)',
+                    'severity': severity,
+                    'description': f'IQR 방법으로 {len(outliers_iqr)}건({outlier_rate:.2f}%)의 이상치가 탐지되었습니다.',
+                    'details': {
+                        'column': col,
+                        'method': 'IQR',
+                        'outlier_count': len(outliers_iqr),
+                        'outlier_rate': round(outlier_rate, 2),
+                        'outlier_values': list(outliers_iqr.head(10))
+                    }
+                })
+            elif len(outliers_z) > 0:
+                # IQR로 탐지 안되면 Z-score로 탐지
+                outlier_rate = (len(outliers_z) / len(self.df)) * 100
+
+                if outlier_rate > 10:
+                    severity = '🔴 높음'
+                elif outlier_rate > 5:
+                    severity = '🟡 중간'
+                else:
+                    severity = '🟢 낮음'
+
+                issues.append({
+                    'title': f'컬럼 "{col}"에서 이상치 발견 (Z-score 방법)',
+                    'severity': severity,
+                    'description': f'Z-score 방법으로 {len(outliers_z)}건({outlier_rate:.2f}%)의 이상치가 탐지되었습니다. (평균: {mean_val:.1f}, 표준편차: {std_val:.1f})',
+                    'details': {
+                        'column': col,
+                        'method': 'Z-score',
+                        'outlier_count': len(outliers_z),
+                        'outlier_rate': round(outlier_rate, 2),
+                        'outlier_values': outliers_z[:10].tolist(),
+                        'mean': round(mean_val, 2),
+                        'std': round(std_val, 2)
+                    }
+                })
 
         return issues
 
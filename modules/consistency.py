@@ -8,12 +8,116 @@ Consistency Checker Module
 import pandas as pd
 import numpy as np
 import re
+from collections import Counter
+from modules.utils import count_severities, stride_sample, SAMPLE_THRESHOLD
+from modules.semantics import column_tags
+
+try:
+    # pyarrow: C++ 문자열 길이/정규식 커널 (선택 의존성)
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+
+# 컬럼명 검사 정규식 (모듈 로드 시 한 번만 컴파일)
+_SPECIAL_CHAR_RE = re.compile(r'[^a-zA-Z0-9_가-힣]')
+_WORD_SPLIT_RE = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)|\d+|[가-힣]+')
+
+# 타입 일관성 검사 그룹 (그룹명, 태그) - 앞선 그룹에 속한 컬럼은 뒤 그룹에서 제외
+_TYPE_GROUPS = (('날짜', 'is_date_or_time'), ('금액', 'is_amount'), ('코드', 'is_code'))
+
+# 유사 명칭 비교 시 제외하는 일반 단어 (코드, 명, id 등)
+_GENERIC_WORDS = frozenset(('cd', 'code', 'id', 'no', 'nm', 'name'))
+
+# 날짜 형식 패턴 (그룹명 -> (형식명, 패턴))
+_DATE_FORMATS = {
+    'iso': ('YYYY-MM-DD', r'\d{4}-\d{2}-\d{2}'),
+    'slash': ('YYYY/MM/DD', r'\d{4}/\d{2}/\d{2}'),
+    'compact': ('YYYYMMDD', r'\d{8}$'),
+    'dmy_dash': ('DD-MM-YYYY', r'\d{2}-\d{2}-\d{4}'),
+    'dmy_slash': ('DD/MM/YYYY', r'\d{2}/\d{2}/\d{4}')
+}
+
+# 모든 날짜 형식을 하나의 정규식으로 결합 (형식끼리 겹치지 않으므로 매칭된 그룹이 곧 형식)
+_DATE_CLASSIFIER = re.compile(
+    '^(?:' + '|'.join(f'(?P<{group}>{pattern})' for group, (_, pattern) in _DATE_FORMATS.items()) + ')'
+)
+
+# Arrow(RE2)용 날짜 형식 패턴 (파이썬 re와 동일하게 \d는 유니코드 숫자, $는 끝 개행 허용)
+_ARROW_DATE_FORMATS = {
+    group: '^' + pattern.replace(r'\d', r'\p{Nd}').replace('$', r'\n?$')
+    for group, (_, pattern) in _DATE_FORMATS.items()
+}
+
+
+def _count_date_formats(values):
+    """값별 날짜 형식 분류 결과 집계 ({그룹명: 건수})"""
+    if pa is not None:
+        try:
+            arr = pa.array(values.to_numpy(dtype=object), type=pa.string())
+        except (pa.ArrowException, UnicodeEncodeError):
+            # 문자열이 아닌 값이 섞인 경우 문자열 변환 후 파이썬 정규식으로 처리
+            arr = None
+
+        if arr is not None:
+            return {
+                group: pc.sum(pc.match_substring_regex(arr, pattern)).as_py() or 0
+                for group, pattern in _ARROW_DATE_FORMATS.items()
+            }
+
+    # 값마다 한 번의 매칭으로 날짜 형식 분류
+    return Counter(
+        match.lastgroup
+        for match in map(_DATE_CLASSIFIER.match, values.astype(str))
+        if match is not None
+    )
+
+
+def _max_strlen(series):
+    """문자열 변환 기준 최대 길이 (astype(str).str.len().max()와 동일한 결과)"""
+    values = series.to_numpy(dtype=object)
+    if values.size == 0:
+        return np.nan
+
+    # NULL은 문자열 변환 시 'nan', 'None' 등으로 표기되므로 그 길이도 포함
+    null_mask = pd.isna(values)
+    max_len = 0
+    if null_mask.any():
+        max_len = max(len(str(v)) for v in pd.unique(values[null_mask]))
+
+    non_null = values[~null_mask]
+    if non_null.size > 0:
+        if pa is not None:
+            try:
+                # 길이 배열을 만들지 않고 길이 계산 + 최댓값을 C++ 커널로 처리
+                return max(max_len, pc.max(pc.utf8_length(pa.array(non_null, type=pa.string()))).as_py())
+            except (pa.ArrowException, UnicodeEncodeError):
+                # 문자열이 아닌 값이 섞인 경우
+                pass
+        max_len = max(max_len, max(map(len, map(str, non_null))))
+
+    return max_len
 
 
 class ConsistencyChecker:
-    def __init__(self, df):
+    # 메트릭 표시 형식 (메트릭은 숫자로 반환하고 화면 표시 시점에 형식 적용)
+    METRIC_FORMATS = {
+        '중복 레코드 비율': '{:.2f}%',
+        'ID 중복 비율': '{:.2f}%',
+        '고유 레코드 수': '{:,}',
+    }
+
+    def __init__(self, df, tags=None, fast_mode=False, sample_threshold=SAMPLE_THRESHOLD):
         self.df = df
         self.name = "일관성 (Consistency)"
+        # 컬럼 의미 태그 (미지정 시 컬럼명으로 분류)
+        self._tags = tags if tags is not None else column_tags(df)
+        # 빠른 모드: 날짜 형식 분류는 임계치 크기의 균등 간격 표본으로 수행
+        self._sample_limit = sample_threshold if fast_mode else None
+        # 컬럼별 메타 정보는 한 번만 계산하여 모든 검사에서 재사용
+        self._dtypes = df.dtypes.to_dict()
+        self._col_lower = {col: str(col).lower() for col in df.columns}
 
     def check(self):
         """일관성 진단 실행"""
@@ -29,8 +133,12 @@ class ConsistencyChecker:
         type_issues = self._check_type_consistency()
         issues.extend(type_issues)
 
+        # 전체 레코드 / ID 컬럼 중복 수는 한 번만 계산하여 중복 검사와 메트릭에 재사용
+        duplicate_count = int(np.count_nonzero(self.df.duplicated().to_numpy()))
+        id_duplicates = self._count_id_duplicates()
+
         # 3. 중복 데이터 검사
-        duplicate_issues = self._check_duplicates()
+        duplicate_issues = self._check_duplicates(duplicate_count, id_duplicates)
         issues.extend(duplicate_issues)
 
         # 4. 코드값 일관성 검사
@@ -42,24 +150,25 @@ class ConsistencyChecker:
         issues.extend(date_issues)
 
         # 메트릭 계산
-        duplicate_rate = (self.df.duplicated().sum() / len(self.df) * 100) if len(self.df) > 0 else 0
+        duplicate_rate = (duplicate_count / len(self.df) * 100) if len(self.df) > 0 else 0
 
         # ID 컬럼 중복률 계산
         id_duplicate_rate = 0
-        id_cols = [col for col in self.df.columns if any(keyword in col.lower() for keyword in ['id', 'key', 'uuid', 'guid', '번호', 'no'])]
+        id_cols = [col for col in self.df.columns if self._tags[col]['is_id']]
         if id_cols:
             max_id_dup_rate = 0
             for col in id_cols:
-                non_null = self.df[col].dropna()
-                if len(non_null) > 0:
-                    dup_rate = (non_null.duplicated().sum() / len(non_null) * 100)
+                # ID 컬럼은 모두 ID/코드 컬럼에 포함되므로 중복 검사 결과 재사용
+                if col in id_duplicates:
+                    dup_count, non_null_count = id_duplicates[col]
+                    dup_rate = (dup_count / non_null_count * 100)
                     max_id_dup_rate = max(max_id_dup_rate, dup_rate)
             id_duplicate_rate = max_id_dup_rate
 
-        metrics['중복 레코드 비율'] = f"{duplicate_rate:.2f}%"
-        metrics['ID 중복 비율'] = f"{id_duplicate_rate:.2f}%"
+        metrics['중복 레코드 비율'] = duplicate_rate
+        metrics['ID 중복 비율'] = id_duplicate_rate
         metrics['컬럼 수'] = len(self.df.columns)
-        metrics['고유 레코드 수'] = f"{len(self.df.drop_duplicates()):,}"
+        metrics['고유 레코드 수'] = len(self.df) - duplicate_count
 
         # 점수 계산 (ID 중복률도 고려)
         score = self._calculate_score(duplicate_rate, id_duplicate_rate, len(issues))
@@ -68,6 +177,7 @@ class ConsistencyChecker:
             'name': self.name,
             'score': score,
             'issues': issues,
+            'severity_counts': count_severities(issues),
             'metrics': metrics
         }
 
@@ -81,11 +191,11 @@ class ConsistencyChecker:
                 issues_detail.append(f"'{col}': 공백 포함")
 
             # 특수문자 확인 (언더스코어 제외)
-            if re.search(r'[^a-zA-Z0-9_가-힣]', col):
+            if _SPECIAL_CHAR_RE.search(col):
                 issues_detail.append(f"'{col}': 특수문자 포함")
 
             # 대소문자 혼용 확인
-            if col != col.lower() and col != col.upper():
+            if col != self._col_lower[col] and col != col.upper():
                 if not col.replace('_', '').isalnum():
                     issues_detail.append(f"'{col}': 대소문자 혼용")
 
@@ -109,22 +219,14 @@ class ConsistencyChecker:
         suffix_groups = {}
 
         for col in self.df.columns:
-            # 날짜 관련 컬럼
-            if any(keyword in col.lower() for keyword in ['date', 'dt', '일자', '날짜', '시간']):
-                suffix_groups.setdefault('날짜', []).append((col, self.df[col].dtype))
-
-            # 금액 관련 컬럼
-            elif any(keyword in col.lower() for keyword in ['amount', 'amt', 'price', '금액', '가격']):
-                suffix_groups.setdefault('금액', []).append((col, self.df[col].dtype))
-
-            # 코드 관련 컬럼
-            elif any(keyword in col.lower() for keyword in ['code', 'cd', '코드']):
-                suffix_groups.setdefault('코드', []).append((col, self.df[col].dtype))
+            # 날짜, 금액, 코드 순으로 처음 해당하는 그룹에 분류
+            group_name = next((name for name, tag in _TYPE_GROUPS if self._tags[col][tag]), None)
+            if group_name is not None:
+                suffix_groups.setdefault(group_name, []).append((col, self._dtypes[col]))
 
         # 각 그룹 내에서 타입 일관성 확인
         for group_name, columns in suffix_groups.items():
-            types = set([dtype for _, dtype in columns])
-            if len(types) > 1:
+            if len({dtype for _, dtype in columns}) > 1:
                 issues.append({
                     'title': f'{group_name} 컬럼 타입 불일치',
                     'severity': '🟡 중간',
@@ -137,16 +239,14 @@ class ConsistencyChecker:
 
         # 동일 명칭 다른 타입/길이 검사
         # 핵심 단어 추출하여 유사한 컬럼 그룹핑
-        from collections import defaultdict
-        import re
 
         # 컬럼명에서 핵심 단어 추출
         col_info = {}
         for col in self.df.columns:
             # 언더스코어나 camelCase로 분리
-            words = re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)|\d+|[가-힣]+', col)
+            words = _WORD_SPLIT_RE.findall(col)
             # 주요 명사 추출 (코드, 명, 명칭, id 등 제외한 핵심 단어)
-            key_words = [w.lower() for w in words if w.lower() not in ['cd', 'code', 'id', 'no', 'nm', 'name']]
+            key_words = [w for w in (w.lower() for w in words) if w not in _GENERIC_WORDS]
 
             if key_words:
                 key = '_'.join(key_words)
@@ -154,9 +254,9 @@ class ConsistencyChecker:
                     col_info[key] = []
 
                 # 타입과 길이 정보 저장
-                dtype = self.df[col].dtype
+                dtype = self._dtypes[col]
                 if dtype == 'object':
-                    max_len = self.df[col].astype(str).str.len().max()
+                    max_len = _max_strlen(self.df[col])
                 else:
                     max_len = None
 
@@ -166,8 +266,7 @@ class ConsistencyChecker:
         for key, cols in col_info.items():
             if len(cols) > 1:
                 # 타입 불일치 검사
-                types = set([dtype for _, dtype, _ in cols])
-                if len(types) > 1:
+                if len({dtype for _, dtype, _ in cols}) > 1:
                     issues.append({
                         'title': f'유사 명칭 컬럼의 타입 불일치',
                         'severity': '🟡 중간',
@@ -181,7 +280,7 @@ class ConsistencyChecker:
                 # 길이 불일치 검사 (문자열 컬럼만)
                 str_cols = [(col, max_len) for col, dtype, max_len in cols if dtype == 'object' and max_len]
                 if len(str_cols) > 1:
-                    lengths = set([max_len for _, max_len in str_cols])
+                    lengths = {max_len for _, max_len in str_cols}
                     if len(lengths) > 1:
                         # 길이 차이가 2배 이상이면 경고
                         min_len = min(lengths)
@@ -201,13 +300,28 @@ class ConsistencyChecker:
 
         return issues
 
-    def _check_duplicates(self):
+    def _count_id_duplicates(self):
+        """ID/키 컬럼별 중복 수 (NULL 제외)
+
+        Returns:
+            dict: {컬럼명: (중복 수, NULL이 아닌 값 수)} (값이 있는 ID/코드 컬럼만)
+        """
+        id_duplicates = {}
+
+        for col in self.df.columns:
+            # ID나 고유 식별자로 추정되는 컬럼
+            if self._tags[col]['is_id_or_code']:
+                non_null = self.df[col].dropna()
+                if len(non_null) > 0:
+                    id_duplicates[col] = (int(np.count_nonzero(non_null.duplicated().to_numpy())), len(non_null))
+
+        return id_duplicates
+
+    def _check_duplicates(self, duplicate_count, id_duplicates):
         """중복 데이터 검사"""
         issues = []
 
         # 1. 전체 레코드 중복 검사
-        duplicate_count = self.df.duplicated().sum()
-
         if duplicate_count > 0:
             duplicate_rate = (duplicate_count / len(self.df)) * 100
 
@@ -230,37 +344,32 @@ class ConsistencyChecker:
             })
 
         # 2. ID/키 컬럼 중복 검사
-        for col in self.df.columns:
-            # ID나 고유 식별자로 추정되는 컬럼
-            if any(keyword in col.lower() for keyword in ['id', 'key', 'uuid', 'guid', '번호', 'no', 'code', 'cd']):
-                # NULL 제외하고 중복 확인
-                non_null = self.df[col].dropna()
-                if len(non_null) > 0:
-                    dup_count = non_null.duplicated().sum()
-                    if dup_count > 0:
-                        dup_rate = (dup_count / len(non_null)) * 100
-
-                        if dup_rate > 10:
-                            severity = '🔴 높음'
-                        elif dup_rate > 5:
-                            severity = '🟡 중간'
-                        else:
-                            severity = '🟢 낮음'
+        for col, (dup_count, non_null_count) in id_duplicates.items():
+            if dup_count > 0:
+                dup_rate = (dup_count / non_null_count) * 100
+
+                if dup_rate > 10:
+                    severity = '🔴 높음'
+                elif dup_rate > 5:
+                    severity = '🟡 중간'
+                else:
+                    severity = '🟢 낮음'
 
-                        # 중복된 값들 확인
-                        dup_values = non_null[non_null.duplicated(keep=False)].value_counts()
+                # 중복된 값들 확인 (한 번의 빈도 집계 후 2건 이상인 값만 정렬)
+                value_counts = self.df[col].value_counts(sort=False)
+                dup_values = value_counts[value_counts > 1].sort_values(ascending=False).head(5)
 
-                        issues.append({
-                            'title': f'컬럼 "{col}"에서 중복 ID 발견',
-                            'severity': severity,
-                            'description': f'고유해야 할 ID 컬럼에서 {dup_count}건({dup_rate:.2f}%)의 중복이 발견되었습니다.',
-                            'details': {
-                                'column': col,
-                                'duplicate_count': int(dup_count),
-                                'duplicate_rate': round(dup_rate, 2),
-                                'duplicate_values': {str(k): int(v) for k, v in dup_values.head(5).items()}
-                            }
-                        })
+                issues.append({
+                    'title': f'컬럼 "{col}"에서 중복 ID 발견',
+                    'severity': severity,
+                    'description': f'고유해야 할 ID 컬럼에서 {dup_count}건({dup_rate:.2f}%)의 중복이 발견되었습니다.',
+                    'details': {
+                        'column': col,
+                        'duplicate_count': int(dup_count),
+                        'duplicate_rate': round(dup_rate, 2),
+                        'duplicate_values': {str(k): int(v) for k, v in dup_values.items()}
+                    }
+                })
 
         return issues
 
@@ -270,7 +379,7 @@ class ConsistencyChecker:
 
         for col in self.df.columns:
             # 코드 컬럼으로 추정되는 경우
-            if any(keyword in col.lower() for keyword in ['code', 'cd', '코드', 'yn', '여부', '구분']):
+            if self._tags[col]['is_code_value']:
                 unique_values = self.df[col].dropna().unique()
 
                 # 유니크 값이 너무 많으면 스킵 (코드 컬럼이 아닐 가능성)
@@ -278,8 +387,8 @@ class ConsistencyChecker:
                     continue
 
                 # 대소문자 혼용 확인
-                if self.df[col].dtype == 'object':
-                    values_lower = set([str(v).lower() for v in unique_values])
+                if self._dtypes[col] == 'object':
+                    values_lower = {str(v).lower() for v in unique_values}
                     if len(values_lower) < len(unique_values):
                         issues.append({
                             'title': f'컬럼 "{col}"의 코드값 대소문자 불일치',
@@ -299,40 +408,40 @@ class ConsistencyChecker:
 
         for col in self.df.columns:
             # 날짜 컬럼으로 추정되는 경우
-            if any(keyword in col.lower() for keyword in ['date', 'dt', '일자', '날짜']):
+            if self._tags[col]['is_date']:
 
-                if self.df[col].dtype == 'object':
+                if self._dtypes[col] == 'object':
                     # NULL이 아닌 값들의 형식 확인
-                    non_null_values = self.df[col].dropna().astype(str)
+                    non_null_values = self.df[col].dropna()
 
                     if len(non_null_values) == 0:
                         continue
 
-                    # 다양한 날짜 형식 패턴
-                    formats = {
-                        'YYYY-MM-DD': r'^\d{4}-\d{2}-\d{2}',
-                        'YYYY/MM/DD': r'^\d{4}/\d{2}/\d{2}',
-                        'YYYYMMDD': r'^\d{8}$',
-                        'DD-MM-YYYY': r'^\d{2}-\d{2}-\d{4}',
-                        'DD/MM/YYYY': r'^\d{2}/\d{2}/\d{4}'
-                    }
+                    sampled_values = stride_sample(non_null_values, self._sample_limit)
+                    sampled = len(sampled_values) < len(non_null_values)
+
+                    matched_groups = _count_date_formats(sampled_values)
 
-                    format_counts = {}
-                    for format_name, pattern in formats.items():
-                        count = non_null_values.str.match(pattern).sum()
-                        if count > 0:
-                            format_counts[format_name] = count
+                    format_counts = {
+                        format_name: matched_groups[group]
+                        for group, (format_name, _) in _DATE_FORMATS.items()
+                        if matched_groups[group] > 0
+                    }
 
                     # 여러 형식이 혼용되는 경우
                     if len(format_counts) > 1:
+                        details = {
+                            'column': col,
+                            'format_counts': format_counts
+                        }
+                        if sampled:
+                            details['sampled'] = True
+
                         issues.append({
                             'title': f'컬럼 "{col}"의 날짜 형식 불일치',
                             'severity': '🟡 중간',
                             'description': '여러 가지 날짜 형식이 혼용되어 있습니다.',
-                            'details': {
-                                'column': col,
-                                'format_counts': format_counts
-                            }
+                            'details': details
                         })
 
         return issues
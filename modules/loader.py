@@ -0,0 +1,106 @@
+"""
+데이터 로드 모듈
+Data Loader Module
+
+업로드된 CSV 파일을 진단용 DataFrame으로 로드합니다.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+try:
+    # pyarrow: 멀티스레드 CSV 파서 (선택 의존성)
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# 고속 파싱(pyarrow CSV 파서) 사용 가능 여부
+FAST_PARSE_AVAILABLE = pa is not None
+
+# pandas read_csv 기본 NULL 문자열 (고속 파서도 동일하게 처리)
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+
+# 정수 표기 값 (Arrow는 + 부호가 있거나 int64 범위를 넘는 정수를 실수로 추론함)
+_INTEGER_TEXT = r'^\s*[+-]?\d+\s*$'
+
+
+def _is_integral(column):
+    """실수 컬럼의 값이 모두 정수값인지 여부 (NULL 제외)"""
+    return bool(pc.all(pc.equal(pc.floor(column), column)).as_py())
+
+
+def _read_csv_arrow(file_bytes):
+    """pyarrow CSV 파서로 로드 (pandas 기본 파서와 타입이 달라지는 입력은 ValueError)"""
+    def read(**convert_kwargs):
+        convert_options = pa_csv.ConvertOptions(
+            null_values=CSV_NA_VALUES,
+            strings_can_be_null=True,
+            **convert_kwargs
+        )
+        return pa_csv.read_csv(pa.BufferReader(file_bytes), convert_options=convert_options)
+
+    table = read()
+
+    # 중복 컬럼명은 pandas처럼 구분할 수 없으므로 기본 파서 사용
+    if len(set(table.column_names)) != len(table.column_names):
+        raise ValueError("duplicate column names")
+
+    # 날짜/시간으로 자동 변환된 컬럼은 원본 문자열로 다시 읽음 (진단은 원본 형식 기준)
+    temporal_cols = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+    # 값이 모두 정수값인 실수 컬럼은 원본 표기를 확인 (pandas는 정수 표기만 있으면 정수/문자열로 읽음)
+    integral_cols = [
+        field.name for field in table.schema
+        if pa.types.is_floating(field.type) and _is_integral(table.column(field.name))
+    ]
+    text_cols = temporal_cols + integral_cols
+    if text_cols:
+        raw = read(
+            include_columns=text_cols,
+            column_types={col: pa.string() for col in text_cols}
+        )
+        for col in integral_cols:
+            if pc.all(pc.match_substring_regex(raw.column(col), _INTEGER_TEXT)).as_py():
+                raise ValueError(f"integer column inferred as double: {col}")
+        for col in temporal_cols:
+            table = table.set_column(table.schema.get_field_index(col), col, raw.column(col))
+
+    # 값이 모두 비어 있는 컬럼은 pandas와 동일하게 float64(NaN)로 변환 (행이 없으면 object 유지)
+    if table.num_rows > 0:
+        for i, field in enumerate(table.schema):
+            if pa.types.is_null(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+
+    df = table.to_pandas()
+
+    # 문자열 컬럼의 결측값을 None 대신 NaN으로 통일
+    object_cols = df.columns[df.dtypes == 'object']
+    if len(object_cols) > 0:
+        df[object_cols] = df[object_cols].where(df[object_cols].notna(), np.nan)
+
+    return df
+
+
+def read_csv(file_bytes, fast_parse=True):
+    """
+    CSV 파일 내용을 DataFrame으로 로드
+
+    Args:
+        file_bytes: CSV 파일 내용
+        fast_parse: pyarrow CSV 파서 사용 여부 (실패하거나 타입이 달라질 수 있으면 pandas 기본 파서 사용)
+
+    Returns:
+        pd.DataFrame: pandas 기본 파서와 같은 타입의 DataFrame
+    """
+    if fast_parse and FAST_PARSE_AVAILABLE:
+        try:
+            return _read_csv_arrow(file_bytes)
+        except Exception:
+            pass
+    return pd.read_csv(io.BytesIO(file_bytes))
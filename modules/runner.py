@@ -0,0 +1,83 @@
+"""
+진단 실행 모듈
+Diagnostic Runner Module
+
+선택된 진단 지표들을 병렬로 실행합니다.
+"""
+
+import os
+import sys
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from modules.completeness import CompletenessChecker
+from modules.consistency import ConsistencyChecker
+from modules.accuracy import AccuracyChecker
+from modules.security import SecurityChecker
+from modules.timeliness import TimelinessChecker
+from modules.usability import UsabilityChecker
+
+
+# 진단 지표별 체커 클래스
+CHECKERS = {
+    'completeness': CompletenessChecker,
+    'consistency': ConsistencyChecker,
+    'accuracy': AccuracyChecker,
+    'security': SecurityChecker,
+    'timeliness': TimelinessChecker,
+    'usability': UsabilityChecker,
+}
+
+
+def run_check(name, df, options=None):
+    """단일 지표 진단 실행 (프로세스 풀에서 호출되도록 모듈 최상위에 정의)"""
+    return name, CHECKERS[name](df, **(options or {})).check()
+
+
+def _make_executor(max_workers):
+    """실행 환경에 맞는 Executor 생성"""
+    # 브라우저(Pyodide) 환경에서는 프로세스를 생성할 수 없으므로 스레드 사용
+    if sys.platform == 'emscripten':
+        return ThreadPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+# 지표별 전용 Executor (재진단 시 같은 워커 프로세스에서 실행되어 프로세스 내 컬럼 결과 캐시 유지)
+_executors = {}
+
+
+def _get_executor(name):
+    """지표별 단일 워커 Executor 반환 (최초 호출 시 생성)"""
+    if name not in _executors:
+        _executors[name] = _make_executor(1)
+    return _executors[name]
+
+
+def iter_checks(names, df, options=None):
+    """
+    선택된 지표들을 병렬로 진단하고 완료되는 순서대로 결과 반환
+
+    Args:
+        names: 진단할 지표명 목록
+        df: 진단 대상 DataFrame
+        options: 지표별 체커 생성 옵션 (예: {'accuracy': {'fast_mode': True}})
+
+    Yields:
+        tuple: (지표명, 진단 결과)
+    """
+    if not names:
+        return
+
+    futures = {
+        _get_executor(name).submit(run_check, name, df, (options or {}).get(name)): name
+        for name in names
+    }
+
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    except BrokenExecutor:
+        # 워커가 비정상 종료된 지표의 Executor는 다음 진단에서 새로 생성
+        for future, name in futures.items():
+            if future.done() and not future.cancelled() and isinstance(future.exception(), BrokenExecutor):
+                _executors.pop(name).shutdown(wait=False)
+        raise
@@ -8,12 +8,61 @@ Security Checker Module
 import pandas as pd
 import numpy as np
 import re
+from modules.utils import count_severities
+from modules.semantics import column_tags
+
+
+# 개인정보 유형별 패턴 (모듈 로드 시 한 번만 컴파일, 먼저 일치하는 유형으로 보고)
+_PII_PATTERNS = {
+    '주민등록번호': re.compile(r'\d{6}-\d{7}'),
+    '이메일': re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'),
+    '전화번호': re.compile(r'01\d-\d{3,4}-\d{4}'),
+    '신용카드': re.compile(r'\d{4}-\d{4}-\d{4}-\d{4}')
+}
+
+# 유형별 패턴이 반드시 포함하는 문자 (정규식 검사 전에 문자열 메서드로 후보 값만 추림)
+_PII_REQUIRED_CHARS = {
+    '주민등록번호': '-',
+    '이메일': '@',
+    '전화번호': '-',
+    '신용카드': '-'
+}
+
+# 모든 개인정보 패턴을 하나로 결합 (어느 유형과도 일치하지 않는 컬럼은 유형별 검사 생략)
+_PII_UNION = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in _PII_PATTERNS.values()))
+
+# 민감정보 유형별 컬럼 의미 태그 (먼저 일치하는 유형으로 분류)
+_SENSITIVE_TAGS = {
+    '비밀번호': 'is_password',
+    '계좌정보': 'is_account',
+    '소득정보': 'is_income',
+    '건강정보': 'is_health',
+    '위치정보': 'is_location'
+}
+
+
+def _as_str(series):
+    """문자열 Series 반환 (모든 값이 이미 문자열이면 변환 복사 없이 그대로 사용)"""
+    if pd.api.types.infer_dtype(series, skipna=False) == 'string':
+        return series
+    return series.astype(str)
+
+
+def _is_long_number(value):
+    """10자리 이상의 숫자로만 구성된 값 여부 (re의 $와 같이 끝의 개행 하나는 허용)"""
+    if value.endswith('\n'):
+        value = value[:-1]
+    return len(value) >= 10 and value.isdecimal()
 
 
 class SecurityChecker:
-    def __init__(self, df):
+    def __init__(self, df, tags=None):
         self.df = df
         self.name = "보안성 (Security)"
+        # 컬럼 의미 태그 (미지정 시 컬럼명으로 분류)
+        self._tags = tags if tags is not None else column_tags(df)
+        # 값 검사 대상 문자열 컬럼 (컬럼 순서 유지)
+        self._object_cols = [col for col, dtype in df.dtypes.items() if dtype == 'object']
 
     def check(self):
         """보안성 진단 실행"""
@@ -46,6 +95,7 @@ class SecurityChecker:
             'name': self.name,
             'score': score,
             'issues': issues,
+            'severity_counts': count_severities(issues),
             'metrics': metrics
         }
 
@@ -53,37 +103,38 @@ class SecurityChecker:
         """개인정보 노출 검사"""
         issues = []
 
-        pii_patterns = {
-            '주민등록번호': r'\d{6}-\d{7}',
-            '이메일': r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            '전화번호': r'01\d-\d{3,4}-\d{4}',
-            '신용카드': r'\d{4}-\d{4}-\d{4}-\d{4}'
-        }
+        for col in self._object_cols:
+            # 컬럼명으로 개인정보 추정 (문자열 컬럼만 값 검사 대상)
+            if self._tags[col]['is_pii']:
+                non_null = self.df[col].dropna()
 
-        for col in self.df.columns:
-            # 컬럼명으로 개인정보 추정
-            if any(keyword in col.lower() for keyword in ['주민', 'ssn', 'rrn', '이메일', 'email', '전화', 'phone', 'tel', '카드', 'card']):
-
-                if self.df[col].dtype == 'object':
-                    non_null = self.df[col].dropna()
-
-                    if len(non_null) > 0:
-                        # 패턴 매칭
-                        for pii_type, pattern in pii_patterns.items():
-                            matches = non_null.astype(str).str.contains(pattern, regex=True, na=False).sum()
-
-                            if matches > 0:
-                                issues.append({
-                                    'title': f'컬럼 "{col}"에 {pii_type} 노출',
-                                    'severity': '🔴 높음',
-                                    'description': f'개인정보({pii_type})가 평문으로 {matches}건 저장되어 있습니다. 암호화 또는 마스킹이 필요합니다.',
-                                    'details': {
-                                        'column': col,
-                                        'pii_type': pii_type,
-                                        'count': int(matches)
-                                    }
-                                })
-                                break
+                if len(non_null) > 0:
+                    values = _as_str(non_null)
+
+                    # 결합 패턴으로 개인정보가 하나라도 있는지 먼저 확인 (첫 일치에서 중단)
+                    if not any(map(_PII_UNION.search, values)):
+                        continue
+
+                    # 패턴 매칭 (필수 문자를 포함한 후보 값에만 정규식 적용, 필수 문자별로 한 번만 추림)
+                    candidates = {}
+                    for pii_type, pattern in _PII_PATTERNS.items():
+                        required = _PII_REQUIRED_CHARS[pii_type]
+                        if required not in candidates:
+                            candidates[required] = values[values.str.contains(required, regex=False, na=False)]
+                        matches = candidates[required].str.contains(pattern, na=False).sum()
+
+                        if matches > 0:
+                            issues.append({
+                                'title': f'컬럼 "{col}"에 {pii_type} 노출',
+                                'severity': '🔴 높음',
+                                'description': f'개인정보({pii_type})가 평문으로 {matches}건 저장되어 있습니다. 암호화 또는 마스킹이 필요합니다.',
+                                'details': {
+                                    'column': col,
+                                    'pii_type': pii_type,
+                                    'count': int(matches)
+                                }
+                            })
+                            break
 
         return issues
 
@@ -91,24 +142,16 @@ class SecurityChecker:
         """민감정보 검사"""
         issues = []
 
-        sensitive_keywords = {
-            '비밀번호': ['password', 'pwd', '비밀번호', '패스워드'],
-            '계좌정보': ['account', '계좌', 'bank'],
-            '소득정보': ['income', '소득', '연봉', 'salary'],
-            '건강정보': ['health', '건강', '질병', 'disease'],
-            '위치정보': ['location', 'gps', '위치', '좌표', 'latitude', 'longitude']
-        }
-
         for col in self.df.columns:
-            for info_type, keywords in sensitive_keywords.items():
-                if any(keyword in col.lower() for keyword in keywords):
+            for info_type, tag in _SENSITIVE_TAGS.items():
+                if self._tags[col][tag]:
                     # 비밀번호는 해싱되어야 함
                     if info_type == '비밀번호':
-                        if self.df[col].dtype == 'object':
+                        if col in self._object_cols:
                             non_null = self.df[col].dropna()
                             if len(non_null) > 0:
                                 # 평문 비밀번호로 추정되는 값 (길이가 너무 짧거나 패턴이 단순한 경우)
-                                simple_passwords = non_null[non_null.astype(str).str.len() < 20].count()
+                                simple_passwords = non_null[_as_str(non_null).str.len() < 20].count()
 
                                 if simple_passwords > 0:
                                     issues.append({
@@ -140,24 +183,24 @@ class SecurityChecker:
         issues = []
 
         # 숫자만으로 구성된 긴 문자열 (카드번호, 계좌번호 등으로 추정)
-        for col in self.df.columns:
-            if self.df[col].dtype == 'object':
-                non_null = self.df[col].dropna()
-
-                if len(non_null) > 0:
-                    # 10자리 이상의 숫자로만 구성된 값
-                    numeric_only = non_null.astype(str).str.match(r'^\d{10,}$').sum()
-
-                    if numeric_only > 0:
-                        issues.append({
-                            'title': f'컬럼 "{col}"의 암호화 필요성 검토',
-                            'severity': '🟡 중간',
-                            'description': f'10자리 이상의 숫자로만 구성된 값이 {numeric_only}건 있습니다. 계좌번호 또는 카드번호일 경우 암호화가 필요합니다.',
-                            'details': {
-                                'column': col,
-                                'count': int(numeric_only)
-                            }
-                        })
+        for col in self._object_cols:
+            non_null = self.df[col].dropna()
+
+            if len(non_null) > 0:
+                # 10자리 이상의 숫자로만 구성된 값 (정규식 대신 문자열 메서드로 판정)
+                values = _as_str(non_null).to_numpy()
+                numeric_only = sum(1 for value in values if _is_long_number(value))
+
+                if numeric_only > 0:
+                    issues.append({
+                        'title': f'컬럼 "{col}"의 암호화 필요성 검토',
+                        'severity': '🟡 중간',
+                        'description': f'10자리 이상의 숫자로만 구성된 값이 {numeric_only}건 있습니다. 계좌번호 또는 카드번호일 경우 암호화가 필요합니다.',
+                        'details': {
+                            'column': col,
+                            'count': int(numeric_only)
+                        }
+                    })
 
         return issues
 
@@ -0,0 +1,79 @@
+"""
+컬럼 의미 분류 모듈
+Column Semantics Module
+
+컬럼명 키워드를 기반으로 컬럼의 의미(여부, 이메일, 날짜 등)를 한 번에 분류하여
+모든 진단 모듈이 공유합니다.
+"""
+
+from functools import lru_cache
+
+
+# 태그별 컬럼명 키워드 (소문자 컬럼명에 부분 문자열로 포함되는지 검사)
+KEYWORDS = {
+    # 정확성
+    'is_yn': ('yn', '여부', '유무'),
+    'is_non_negative': ('수량', '건수', '횟수', 'count', 'quantity', '나이', 'age'),
+    'is_rate': ('율', 'rate', 'ratio', 'percent', '%'),
+    'is_age': ('나이', 'age'),
+    'is_year': ('년도', 'year', '연도', 'join_year', 'birth_year', '가입년도', '생년'),
+    'is_year_birth': ('birth', '생년', '출생'),
+    'is_year_join': ('join', '가입', '등록', 'register'),
+    'is_name': ('이름', 'name', '성명', '직위', '부서', '명칭'),
+    'is_email': ('email', '이메일', 'mail'),
+    'is_phone': ('phone', 'tel', '전화', '연락처', '휴대폰'),
+    'is_date': ('date', 'dt', '일자', '날짜'),
+    'is_start': ('시작', 'start', 'from', '등록', '착공'),
+    'is_end': ('종료', 'end', 'to', '완료', '준공'),
+    'is_discard_date': ('폐기일', '삭제일', 'delete_date'),
+    'is_discard_reason': ('폐기사유', '폐기이유', '삭제사유', 'delete_reason'),
+
+    # 일관성 / 유용성
+    'is_date_or_time': ('date', 'dt', '일자', '날짜', '시간'),
+    'is_amount': ('amount', 'amt', 'price', '금액', '가격'),
+    'is_code': ('code', 'cd', '코드'),
+    'is_id': ('id', 'key', 'uuid', 'guid', '번호', 'no'),
+    'is_id_or_code': ('id', 'key', 'uuid', 'guid', '번호', 'no', 'code', 'cd'),
+    'is_code_value': ('code', 'cd', '코드', 'yn', '여부', '구분'),
+
+    # 보안성
+    'is_pii': ('주민', 'ssn', 'rrn', '이메일', 'email', '전화', 'phone', 'tel', '카드', 'card'),
+    'is_password': ('password', 'pwd', '비밀번호', '패스워드'),
+    'is_account': ('account', '계좌', 'bank'),
+    'is_income': ('income', '소득', '연봉', 'salary'),
+    'is_health': ('health', '건강', '질병', 'disease'),
+    'is_location': ('location', 'gps', '위치', '좌표', 'latitude', 'longitude'),
+
+    # 적시성
+    'is_timestamp': ('date', 'dt', '일자', '날짜', '시간', 'time', '등록', '수정', '생성', 'created', 'updated', 'modified'),
+    'is_updated': ('수정', '갱신', 'updated', 'modified'),
+    'is_scheduled': ('예약', '예정', 'scheduled', 'planned', 'expected'),
+}
+
+
+@lru_cache(maxsize=128)
+def classify(columns):
+    """
+    컬럼명 튜플을 의미 태그로 분류
+
+    Args:
+        columns: 컬럼명 튜플 (캐시 키로 사용되므로 hashable이어야 함)
+
+    Returns:
+        dict: {컬럼명: {태그: bool}}
+    """
+    tags = {}
+
+    for col in columns:
+        col_lower = str(col).lower()
+        tags[col] = {
+            tag: any(keyword in col_lower for keyword in keywords)
+            for tag, keywords in KEYWORDS.items()
+        }
+
+    return tags
+
+
+def column_tags(df):
+    """DataFrame 컬럼의 의미 태그 반환"""
+    return classify(tuple(df.columns))
@@ -7,40 +7,44 @@ Timeliness Checker Module
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from modules.utils import count_severities
+from modules.semantics import column_tags
 
 
 class TimelinessChecker:
-    def __init__(self, df):
+    def __init__(self, df, tags=None):
         self.df = df
         self.name = "적시성 (Timeliness)"
+        # 컬럼 의미 태그 (미지정 시 컬럼명으로 분류)
+        self._tags = tags if tags is not None else column_tags(df)
+        # 날짜 컬럼 목록은 한 번만 추출하여 모든 검사에서 재사용
+        self._date_cols = self._get_date_columns()
 
     def check(self):
         """적시성 진단 실행"""
         issues = []
         metrics = {}
 
-        # 1. 최신값 검사
-        freshness_issues = self._check_data_freshness()
-        issues.extend(freshness_issues)
+        # 날짜 컬럼별 변환 결과와 최신 날짜는 한 번만 계산하여 모든 검사에서 재사용
+        self._parsed_dates = self._parse_dates()
+        self._max_dates = {col: dates.max() for col, dates in self._parsed_dates.items()}
 
-        # 2. 날짜 컬럼 갱신 주기 검사
-        update_issues = self._check_update_frequency()
-        issues.extend(update_issues)
+        # 기준 시각은 한 번만 구하여 모든 컬럼 검사와 메트릭에 동일하게 적용
+        now = pd.Timestamp.now()
 
-        # 3. 미래 날짜 검사
-        future_issues = self._check_future_dates()
+        # 1~3. 최신값 / 갱신 주기 / 미래 날짜 검사 (날짜 컬럼마다 한 번만 순회)
+        freshness_issues, update_issues, future_issues = self._check_date_columns(now)
+        issues.extend(freshness_issues)
+        issues.extend(update_issues)
         issues.extend(future_issues)
 
         # 메트릭 계산
-        date_cols = self._get_date_columns()
+        date_cols = self._date_cols
 
         if date_cols:
             latest_date = None
-            for col in date_cols:
+            for col, max_date in self._max_dates.items():
                 try:
-                    dates = pd.to_datetime(self.df[col], errors='coerce')
-                    max_date = dates.max()
                     if pd.notna(max_date):
                         if latest_date is None or max_date > latest_date:
                             latest_date = max_date
@@ -48,7 +52,7 @@ class TimelinessChecker:
                     pass
 
             if latest_date:
-                days_old = (pd.Timestamp.now() - latest_date).days
+                days_old = (now - latest_date).days
                 metrics['최신 데이터'] = latest_date.strftime('%Y-%m-%d')
                 metrics['경과 일수'] = f"{days_old}일"
             else:
@@ -67,6 +71,7 @@ class TimelinessChecker:
             'name': self.name,
             'score': score,
             'issues': issues,
+            'severity_counts': count_severities(issues),
             'metrics': metrics
         }
 
@@ -76,7 +81,7 @@ class TimelinessChecker:
 
         for col in self.df.columns:
             # 컬럼명으로 날짜 컬럼 추정
-            if any(keyword in col.lower() for keyword in ['date', 'dt', '일자', '날짜', '시간', 'time', '등록', '수정', '생성', 'created', 'updated', 'modified']):
+            if self._tags[col]['is_timestamp']:
                 date_cols.append(col)
             # datetime 타입인 경우
             elif pd.api.types.is_datetime64_any_dtype(self.df[col]):
@@ -84,114 +89,125 @@ class TimelinessChecker:
 
         return date_cols
 
-    def _check_data_freshness(self):
-        """데이터 최신성 검사"""
-        issues = []
-
-        date_cols = self._get_date_columns()
+    def _parse_dates(self):
+        """날짜 컬럼별 datetime 변환 결과 (변환할 수 없는 컬럼 제외)"""
+        parsed_dates = {}
 
-        for col in date_cols:
+        for col in self._date_cols:
             try:
-                dates = pd.to_datetime(self.df[col], errors='coerce')
-                valid_dates = dates.dropna()
-
-                if len(valid_dates) > 0:
-                    max_date = valid_dates.max()
-                    days_old = (pd.Timestamp.now() - max_date).days
-
-                    # 수정/갱신 날짜인 경우
-                    if any(keyword in col.lower() for keyword in ['수정', '갱신', 'updated', 'modified']):
-                        if days_old > 180:  # 6개월
-                            severity = '🔴 높음'
-                            description = f'최근 수정일이 {days_old}일 전입니다. 데이터가 장기간 갱신되지 않았습니다.'
-                        elif days_old > 90:  # 3개월
-                            severity = '🟡 중간'
-                            description = f'최근 수정일이 {days_old}일 전입니다. 데이터 갱신이 필요할 수 있습니다.'
-                        else:
-                            continue
-
-                        issues.append({
-                            'title': f'컬럼 "{col}"의 데이터 최신성 부족',
-                            'severity': severity,
-                            'description': description,
-                            'details': {
-                                'column': col,
-                                'latest_date': max_date.strftime('%Y-%m-%d'),
-                                'days_old': days_old
-                            }
-                        })
-
+                parsed_dates[col] = pd.to_datetime(self.df[col], errors='coerce')
             except:
                 pass
 
-        return issues
+        return parsed_dates
 
-    def _check_update_frequency(self):
-        """갱신 주기 검사"""
-        issues = []
+    def _check_date_columns(self, now):
+        """날짜 컬럼별 최신성, 갱신 주기, 미래 날짜를 컬럼마다 한 번의 순회로 검사
 
-        date_cols = self._get_date_columns()
+        Args:
+            now: 경과 일수와 미래 날짜 판정의 기준 시각
 
-        for col in date_cols:
-            try:
-                dates = pd.to_datetime(self.df[col], errors='coerce')
-                valid_dates = dates.dropna().sort_values()
-
-                if len(valid_dates) > 1:
-                    # 날짜 간격 계산
-                    date_diffs = valid_dates.diff().dt.days.dropna()
-
-                    if len(date_diffs) > 0:
-                        avg_interval = date_diffs.mean()
-                        std_interval = date_diffs.std()
-
-                        # 간격이 불규칙한 경우 (표준편차가 평균의 50% 이상)
-                        if std_interval > avg_interval * 0.5:
-                            issues.append({
-                                'title': f'컬럼 "{col}"의 갱신 주기 불규칙',
-                                'severity': '🟡 중간',
-                                'description': f'데이터 갱신 주기가 불규칙합니다. 평균 {avg_interval:.1f}일, 표준편차 {std_interval:.1f}일',
-                                'details': {
-                                    'column': col,
-                                    'avg_interval_days': round(avg_interval, 1),
-                                    'std_interval_days': round(std_interval, 1)
-                                }
-                            })
+        Returns:
+            tuple: (최신성 이슈 목록, 갱신 주기 이슈 목록, 미래 날짜 이슈 목록)
+        """
+        freshness_issues = []
+        update_issues = []
+        future_issues = []
 
-            except:
-                pass
+        for col, dates in self._parsed_dates.items():
+            # 유효한 날짜는 한 번만 추출하여 세 검사에서 공유
+            valid_dates = dates.dropna()
 
-        return issues
+            if len(valid_dates) == 0:
+                continue
 
-    def _check_future_dates(self):
-        """미래 날짜 검사"""
-        issues = []
-
-        date_cols = self._get_date_columns()
-        now = pd.Timestamp.now()
-
-        for col in date_cols:
-            try:
-                dates = pd.to_datetime(self.df[col], errors='coerce')
-                future_dates = (dates > now).sum()
-
-                if future_dates > 0:
-                    # 예약/예정 날짜가 아닌 경우
-                    if not any(keyword in col.lower() for keyword in ['예약', '예정', 'scheduled', 'planned', 'expected']):
-                        issues.append({
-                            'title': f'컬럼 "{col}"에 미래 날짜 존재',
-                            'severity': '🟡 중간',
-                            'description': f'현재 시점보다 미래의 날짜가 {future_dates}건 존재합니다.',
-                            'details': {
-                                'column': col,
-                                'future_count': int(future_dates)
-                            }
-                        })
+            checks = (
+                (freshness_issues, self._check_data_freshness, (col, self._max_dates[col], now)),
+                (update_issues, self._check_update_frequency, (col, valid_dates)),
+                (future_issues, self._check_future_dates, (col, valid_dates, now)),
+            )
+            for issues, rule, args in checks:
+                try:
+                    issue = rule(*args)
+                    if issue:
+                        issues.append(issue)
+                except:
+                    pass
 
-            except:
-                pass
+        return freshness_issues, update_issues, future_issues
 
-        return issues
+    def _check_data_freshness(self, col, max_date, now):
+        """데이터 최신성 검사"""
+        days_old = (now - max_date).days
+
+        # 수정/갱신 날짜인 경우
+        if self._tags[col]['is_updated']:
+            if days_old > 180:  # 6개월
+                severity = '🔴 높음'
+                description = f'최근 수정일이 {days_old}일 전입니다. 데이터가 장기간 갱신되지 않았습니다.'
+            elif days_old > 90:  # 3개월
+                severity = '🟡 중간'
+                description = f'최근 수정일이 {days_old}일 전입니다. 데이터 갱신이 필요할 수 있습니다.'
+            else:
+                return None
+
+            return {
+                'title': f'컬럼 "{col}"의 데이터 최신성 부족',
+                'severity': severity,
+                'description': description,
+                'details': {
+                    'column': col,
+                    'latest_date': max_date.strftime('%Y-%m-%d'),
+                    'days_old': days_old
+                }
+            }
+        return None
+
+    def _check_update_frequency(self, col, valid_dates):
+        """갱신 주기 검사"""
+        if len(valid_dates) > 1:
+            # 날짜 간격 계산 (복사한 NumPy 배열을 제자리 정렬 후 일 단위 차이)
+            values = valid_dates.to_numpy(dtype=valid_dates.dtype.base, copy=True)
+            values.sort()
+            date_diffs = np.diff(values) // np.timedelta64(1, 'D')
+
+            # 간격이 하나뿐이면 표준편차를 정의할 수 없으므로 불규칙 여부 판단 생략
+            if len(date_diffs) < 2:
+                return None
+
+            avg_interval = date_diffs.mean()
+            std_interval = date_diffs.std(ddof=1)
+
+            # 간격이 불규칙한 경우 (표준편차가 평균의 50% 이상)
+            if std_interval > avg_interval * 0.5:
+                return {
+                    'title': f'컬럼 "{col}"의 갱신 주기 불규칙',
+                    'severity': '🟡 중간',
+                    'description': f'데이터 갱신 주기가 불규칙합니다. 평균 {avg_interval:.1f}일, 표준편차 {std_interval:.1f}일',
+                    'details': {
+                        'column': col,
+                        'avg_interval_days': round(avg_interval, 1),
+                        'std_interval_days': round(std_interval, 1)
+                    }
+                }
+        return None
+
+    def _check_future_dates(self, col, valid_dates, now):
+        """미래 날짜 검사"""
+        future_dates = int(np.count_nonzero((valid_dates > now).to_numpy()))
+
+        # 예약/예정 날짜가 아닌 경우
+        if future_dates > 0 and not self._tags[col]['is_scheduled']:
+            return {
+                'title': f'컬럼 "{col}"에 미래 날짜 존재',
+                'severity': '🟡 중간',
+                'description': f'현재 시점보다 미래의 날짜가 {future_dates}건 존재합니다.',
+                'details': {
+                    'column': col,
+                    'future_count': future_dates
+                }
+            }
+        return None
 
     def _calculate_score(self, issues, metrics):
         """점수 계산 (엄격한 기준)"""
@@ -7,12 +7,30 @@ Usability Checker Module
 
 import pandas as pd
 import numpy as np
+from modules.utils import count_severities
+from modules.semantics import column_tags
+
+
+def _top_values(series, n=5):
+    """빈도 상위 값 목록 [(값, 건수), ...] (value_counts().head(n)과 동일한 순서)"""
+    if series.dtype != 'object':
+        return list(series.value_counts().head(n).to_dict().items())
+
+    # 문자열 해시는 정수 코드 변환 시 한 번만 수행하고 빈도는 코드로 집계 (코드 순서 = 첫 등장 순서)
+    codes, uniques = pd.factorize(series)
+    counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(uniques)), index=uniques)
+    return list(counts.sort_values(ascending=False).head(n).to_dict().items())
 
 
 class UsabilityChecker:
-    def __init__(self, df):
+    def __init__(self, df, tags=None):
         self.df = df
         self.name = "유용성 (Usability)"
+        # 컬럼 의미 태그 (미지정 시 컬럼명으로 분류)
+        self._tags = tags if tags is not None else column_tags(df)
+        # 컬럼별 값 개수와 고유값 개수는 한 번에 계산하여 모든 검사에서 재사용
+        self._counts = df.count()
+        self._nunique = df.nunique()
 
     def check(self):
         """유용성 진단 실행"""
@@ -34,7 +52,7 @@ class UsabilityChecker:
         # 메트릭 계산
         total_rows = len(self.df)
         total_cols = len(self.df.columns)
-        usable_cols = sum([1 for col in self.df.columns if self.df[col].notna().sum() > 0])
+        usable_cols = int(np.count_nonzero(self._counts.to_numpy() > 0))
 
         metrics['전체 레코드 수'] = f"{total_rows:,}"
         metrics['전체 컬럼 수'] = total_cols
@@ -48,6 +66,7 @@ class UsabilityChecker:
             'name': self.name,
             'score': score,
             'issues': issues,
+            'severity_counts': count_severities(issues),
             'metrics': metrics
         }
 
@@ -85,12 +104,12 @@ class UsabilityChecker:
         """컬럼 유용성 검사"""
         issues = []
 
-        for col in self.df.columns:
-            non_null_count = self.df[col].notna().sum()
-            total_count = len(self.df)
+        total_count = len(self.df)
+        if total_count == 0:
+            return issues
 
-            if total_count == 0:
-                continue
+        for col in self.df.columns:
+            non_null_count = self._counts[col]
 
             # 값이 거의 없는 컬럼
             fill_rate = (non_null_count / total_count) * 100
@@ -127,13 +146,12 @@ class UsabilityChecker:
         issues = []
 
         for col in self.df.columns:
-            non_null = self.df[col].dropna()
+            total_count = int(self._counts[col])
 
-            if len(non_null) == 0:
+            if total_count == 0:
                 continue
 
-            unique_count = non_null.nunique()
-            total_count = len(non_null)
+            unique_count = int(self._nunique[col])
 
             # 다양성이 너무 낮은 경우 (모든 값이 거의 동일)
             diversity_rate = (unique_count / total_count) * 100
@@ -148,14 +166,14 @@ class UsabilityChecker:
                         'unique_count': unique_count,
                         'total_count': total_count,
                         'diversity_rate': round(diversity_rate, 2),
-                        'top_values': list(non_null.value_counts().head(5).to_dict().items())
+                        'top_values': _top_values(self.df[col])
                     }
                 })
 
             # 카디널리티가 너무 높은 경우 (ID나 고유값이 아닌데 모든 값이 다른 경우)
             elif diversity_rate > 95 and total_count > 100:
                 # ID나 고유 식별자로 보이지 않는 경우
-                if not any(keyword in col.lower() for keyword in ['id', 'key', 'uuid', 'guid', '번호', 'no']):
+                if not self._tags[col]['is_id']:
                     issues.append({
                         'title': f'컬럼 "{col}"의 카디널리티 과다',
                         'severity': '🟢 낮음',
@@ -6,6 +6,36 @@
 import pandas as pd
 import numpy as np
 import re
+from collections import Counter
+
+try:
+    # Optional: JIT-compiled parallel reductions for large numeric columns
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    # Optional: fused multi-threaded elementwise expressions
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+# 빠른 모드 표본 크기 (이 행 수를 초과하면 표본으로 검사)
+SAMPLE_THRESHOLD = 200_000
+
+# 이메일 주소 패턴 (모듈 로드 시 한 번만 컴파일)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# 고유성 검사 시 한 번에 해시하는 값 개수 (중복이 발견되면 남은 값은 검사하지 않음)
+_UNIQUE_CHUNK_SIZE = 1 << 16
+
+# 심각도 아이콘 -> 집계 키
+SEVERITY_LEVELS = {
+    '🔴': 'high',
+    '🟡': 'medium',
+    '🟢': 'low'
+}
 
 
 def safe_get_column_index(default_index, max_index):
@@ -17,9 +47,19 @@ def safe_is_unique(series):
     """Safely check if a series has unique values, handling edge cases"""
     try:
         if series.dtype == 'object':
-            # For object types, handle NaN values properly
-            non_null_values = series.dropna()
-            return non_null_values.is_unique and len(non_null_values) == len(series.dropna())
+            # For object types, ignore NaN values and stop at the first chunk containing a duplicate
+            values = series.to_numpy()
+            null_mask = pd.isna(values)
+            if null_mask.any():
+                values = values[~null_mask]
+
+            seen = set()
+            for start in range(0, len(values), _UNIQUE_CHUNK_SIZE):
+                seen.update(values[start:start + _UNIQUE_CHUNK_SIZE])
+                if len(seen) < min(start + _UNIQUE_CHUNK_SIZE, len(values)):
+                    return False
+            return True
+        # Numeric and other dtypes use pandas' C-level hash table directly
         return series.is_unique
     except:
         return True  # Default to unique if we can't determine
@@ -36,10 +76,10 @@ def safe_to_datetime(series):
 def safe_email_pattern_check(series):
     """Safely check email patterns"""
     try:
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
         if series.dtype == 'object':
-            email_matches = series.str.contains(email_pattern, na=False, regex=True)
-            invalid_emails = series[~series.str.match(email_pattern, na=False)]
+            # The pattern is anchored, so one match pass answers both questions
+            email_matches = series.str.match(_EMAIL_RE, na=False)
+            invalid_emails = series[~email_matches]
             return email_matches.any(), invalid_emails
         return False, pd.Series(dtype=object)
     except:
@@ -57,6 +97,89 @@ def safe_check_business_rules(df, col_name):
         return pd.Series(dtype=object)
 
 
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _count_out_of_range_jit(arr, lo, hi):
+        count = 0
+        for i in prange(arr.size):
+            value = arr[i]
+            if value < lo or value > hi:
+                count += 1
+        return count
+
+    @njit(parallel=True, cache=True)
+    def _scan_range_jit(arr, lo, hi):
+        count = 0
+        lowest = np.inf
+        highest = -np.inf
+        for i in prange(arr.size):
+            value = arr[i]
+            if value < lo or value > hi:
+                count += 1
+            if value == value:
+                lowest = min(lowest, value)
+                highest = max(highest, value)
+        return count, lowest, highest
+
+
+def stride_sample(series, limit):
+    """
+    Evenly spaced sample of at most `limit` rows, keeping the original order
+
+    Returns the series itself when `limit` is None or the series already fits.
+    """
+    if limit is None or len(series) <= limit:
+        return series
+    step = -(-len(series) // limit)
+    return series.iloc[::step]
+
+
+def count_out_of_range(arr, lo, hi):
+    """
+    Count values outside [lo, hi] in a float64 array (NaN is ignored)
+
+    Uses a Numba parallel kernel when available, otherwise a single fused NumPy pass.
+    """
+    if njit is not None:
+        return int(_count_out_of_range_jit(arr, lo, hi))
+    return int(np.count_nonzero((arr < lo) | (arr > hi)))
+
+
+def scan_range(arr, lo, hi):
+    """
+    Count values outside [lo, hi] and get the min/max of a numeric array (NaN is ignored)
+
+    The Numba kernel does all three in one pass. The NumPy fallback only scans for
+    min/max when something is out of range, since callers report them only then.
+
+    Returns:
+        tuple: (out-of-range count, min, max); min/max are only meaningful when the count is non-zero
+    """
+    if njit is not None:
+        count, lowest, highest = _scan_range_jit(arr, lo, hi)
+        return int(count), float(lowest), float(highest)
+
+    count = int(np.count_nonzero((arr < lo) | (arr > hi)))
+    if count == 0:
+        return count, np.nan, np.nan
+    return count, float(np.nanmin(arr)), float(np.nanmax(arr))
+
+
+def count_later(start, end):
+    """
+    Count rows where start is later than end in two datetime64 series (NaT is ignored)
+
+    Compares the int64 views in one fused NumExpr pass when available, otherwise with NumPy.
+    """
+    s = start.to_numpy().view('i8')
+    e = end.to_numpy().view('i8')
+    nat = np.iinfo(np.int64).min
+
+    if ne is not None:
+        return int(np.count_nonzero(ne.evaluate('(s > e) & (s != nat) & (e != nat)')))
+    return int(np.count_nonzero((s > e) & (s != nat) & (e != nat)))
+
+
 def safe_outlier_detection(series):
     """
     Safely detect outliers using IQR method
@@ -67,32 +190,33 @@ def safe_outlier_detection(series):
     - IQR = Q3 - Q1
     - 이상치: Q1 - 1.5*IQR 미만 또는 Q3 + 1.5*IQR 초과
     """
+    empty = pd.Series(dtype='object', name=series.name if hasattr(series, 'name') else None)
     try:
-        if pd.api.types.is_numeric_dtype(series):
-            series_numeric = pd.to_numeric(series, errors='coerce')
-            series_clean = series_numeric.dropna()
-
-            if len(series_clean) < 4:  # Need at least 4 points for IQR
-                return pd.Series(dtype='object', name=series.name if hasattr(series, 'name') else None)
-
-            Q1 = series_clean.quantile(0.25)
-            Q3 = series_clean.quantile(0.75)
+        # Boolean values have no meaningful quantile distance
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            # Convert once to a float array (NULL -> NaN) and compute quantiles on the valid values
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid_mask = ~np.isnan(values)
+            clean = values[valid_mask]
+
+            if clean.size < 4:  # Need at least 4 points for IQR
+                return empty
+
+            # clean is a private copy, so numpy may partition it in place
+            Q1, Q3 = np.quantile(clean, [0.25, 0.75], overwrite_input=True)
             IQR = Q3 - Q1
 
             if IQR == 0:  # All values are the same
-                return pd.Series(dtype='object', name=series.name if hasattr(series, 'name') else None)
+                return empty
 
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
 
-            series_as_numeric = pd.to_numeric(series, errors='coerce')
-            outlier_mask = (series_as_numeric < lower_bound) | (series_as_numeric > upper_bound)
-            outliers = series[outlier_mask]
-
-            return outliers
-        return pd.Series(dtype='object', name=series.name if hasattr(series, 'name') else None)
+            outlier_mask = valid_mask & ((values < lower_bound) | (values > upper_bound))
+            return series.iloc[np.flatnonzero(outlier_mask)]
+        return empty
     except:
-        return pd.Series(dtype='object', name=series.name if hasattr(series, 'name') else None)
+        return empty
 
 
 def calculate_uniqueness_metrics(series):
@@ -110,11 +234,12 @@ def calculate_uniqueness_metrics(series):
     """
     try:
         total_count = len(series)
-        unique_count = series.nunique()
 
-        value_counts = series.value_counts()
-        unique_once_count = (value_counts == 1).sum()
-        duplicate_occurrences = value_counts[value_counts > 1].sum() if not value_counts.empty else 0
+        # One hash pass: the value counts give the distinct, single and repeated occurrence counts
+        counts = series.value_counts(sort=False).to_numpy()
+        unique_count = int(counts.size)
+        unique_once_count = int(np.count_nonzero(counts == 1))
+        duplicate_occurrences = int(counts[counts > 1].sum())
         uniqueness_rate = (unique_once_count / total_count * 100) if total_count > 0 else 0
 
         return {
@@ -143,24 +268,28 @@ def detect_pattern_deviation(series):
     """
     try:
         if pd.api.types.is_numeric_dtype(series):
-            # 수치형 데이터: Z-score 기반 이상치
-            if series.count() > 0:
-                mean_val = series.mean()
-                std_val = series.std()
+            # 수치형 데이터: Z-score 기반 이상치 (NULL 제외한 NumPy 배열에서 |x - 평균| > 3 * 표준편차)
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            if values.size > 1:
+                mean_val = values.mean()
+                std_val = values.std(ddof=1)
                 if std_val and std_val != 0:
-                    z_scores = ((series - mean_val) / std_val).abs()
-                    return (z_scores > 3).sum()
+                    return int(np.count_nonzero(np.abs(values - mean_val) > 3 * std_val))
             return 0
 
         elif pd.api.types.is_object_dtype(series):
-            # 텍스트 데이터: 길이 분석
-            lengths = series.astype(str).str.len()
-            if len(lengths) > 0:
+            # 텍스트 데이터: 길이 분석 (문자열 변환 기준 길이를 NumPy 배열로 직접 생성)
+            lengths = np.fromiter(
+                (len(value) if isinstance(value, str) else len(str(value)) for value in series.to_numpy()),
+                dtype=np.int64,
+                count=len(series)
+            )
+            if lengths.size > 1:
                 mean_len = lengths.mean()
-                std_len = lengths.std()
+                std_len = lengths.std(ddof=1)
                 if std_len and std_len != 0:
-                    z_scores = ((lengths - mean_len) / std_len).abs()
-                    return (z_scores > 3).sum()
+                    return int(np.count_nonzero(np.abs(lengths - mean_len) > 3 * std_len))
             return 0
 
         return 0
@@ -168,6 +297,12 @@ def detect_pattern_deviation(series):
         return 0
 
 
+def count_severities(issues):
+    """Count issues per severity level in a single pass"""
+    counts = Counter(SEVERITY_LEVELS.get(issue.get('severity', '')[:1]) for issue in issues)
+    return {level: counts[level] for level in SEVERITY_LEVELS.values()}
+
+
 def format_percentage(value, total):
     """Safely format percentage"""
     try:
@@ -178,6 +313,16 @@ def format_percentage(value, total):
         return "N/A"
 
 
+def render_metrics(metrics, formats=None):
+    """Format raw metric values for display (values without a format are kept as is)"""
+    if not formats:
+        return dict(metrics)
+    return {
+        name: formats[name].format(value) if name in formats else value
+        for name, value in metrics.items()
+    }
+
+
 def get_severity_color(severity):
     """Get color for severity level"""
     severity_colors = {
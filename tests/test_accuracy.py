@@ -0,0 +1,126 @@
+"""
+정확성 진단 모듈 테스트
+
+형식 검사 정규식이 정규식 엔진(Python re, google-re2, pyarrow RE2)과 관계없이
+같은 값을 오류로 판정하는지, 컬럼 규칙 결과 캐시가 내용 변경을 반영하는지 검증합니다.
+"""
+
+import re
+import sys
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from modules import accuracy
+from modules.accuracy import (
+    AccuracyChecker, _EMAIL_RE, _HANGUL_JAMO_RE, _NO_LETTER_RE, _PHONE_RE, _RE2_SPACE, _regex_mask,
+)
+
+# 엔진별 동작이 갈리기 쉬운 값 (끝 개행, 전각 숫자, 유니코드 공백 등)
+TRICKY_VALUES = [
+    'x@y.co', 'x@y.co\n', 'x@y.co\n\n', 'x@y.co ', '\nx@y.co',
+    '010-1234-5678', '010-1234-5678\n', '０１０-１２３４-５６７８', '٠١٠ ١٢٣٤',
+    '+82 (10) 1234　5678', '010\xa01234', '010\x1c1234', '010 1234', '010​1234',
+    '---', '１２３', '12\n34', 'ㄱㄴ', '홍길동', 'abc', '', ' ', '\n',
+]
+
+
+def _python_mask(values, pattern):
+    regex = re.compile(pattern.pattern)
+    return [regex.match(v) is not None for v in values]
+
+
+@unittest.skipIf(accuracy.re2 is None, 'google-re2 미설치')
+class ObjectPatternTest(unittest.TestCase):
+    def test_re_and_re2_engines_agree(self):
+        values = pd.Series(TRICKY_VALUES, dtype=object)
+        for engine, patterns in (('re', {}), ('re2', accuracy._RE2_PATTERNS)):
+            with mock.patch.object(accuracy, '_RE2_PATTERNS', patterns):
+                for pattern in (_EMAIL_RE, _PHONE_RE, _NO_LETTER_RE):
+                    with self.subTest(engine=engine, pattern=pattern.pattern):
+                        self.assertEqual(_regex_mask(values, pattern).tolist(), _python_mask(TRICKY_VALUES, pattern))
+                with self.subTest(engine=engine, pattern=_HANGUL_JAMO_RE.pattern):
+                    expected = [_HANGUL_JAMO_RE.search(v) is not None for v in TRICKY_VALUES]
+                    self.assertEqual(_regex_mask(values, _HANGUL_JAMO_RE, search=True).tolist(), expected)
+
+
+@unittest.skipIf(accuracy._ARROW_STRING is None, 'pyarrow 미설치')
+class ArrowPatternTest(unittest.TestCase):
+    def test_arrow_mask_matches_python_re(self):
+        values = pd.Series(TRICKY_VALUES).astype(accuracy._ARROW_STRING)
+        for pattern in (_EMAIL_RE, _PHONE_RE, _NO_LETTER_RE):
+            with self.subTest(pattern=pattern.pattern):
+                self.assertEqual(_regex_mask(values, pattern).tolist(), _python_mask(TRICKY_VALUES, pattern))
+
+    def test_re2_space_matches_str_isspace(self):
+        spaces = [chr(code) for code in range(sys.maxunicode + 1) if chr(code).isspace()]
+        values = pd.Series(spaces + ['a', '​']).astype(accuracy._ARROW_STRING)
+        mask = values.str.match(f'^[{_RE2_SPACE}]$').tolist()
+        self.assertEqual(mask, [True] * len(spaces) + [False, False])
+
+
+class FormatCheckTest(unittest.TestCase):
+    def test_email_trailing_newline_is_valid(self):
+        df = pd.DataFrame({'email': ['x@y.co\n', 'a@b.kr', 'not-an-email']})
+        issue = AccuracyChecker(df)._check_email_format('email')
+        self.assertEqual(issue['details']['error_count'], 1)
+        self.assertEqual(issue['details']['examples'], ['not-an-email'])
+
+    def test_full_width_digit_phone_is_valid(self):
+        df = pd.DataFrame({'phone': ['０１０-１２３４-５６７８', '010　1234　5678', '010-abcd']})
+        issue = AccuracyChecker(df)._check_phone_format('phone')
+        self.assertEqual(issue['details']['error_count'], 1)
+        self.assertEqual(issue['details']['examples'], ['010-abcd'])
+
+    def test_korean_digits_only_is_valid(self):
+        df = pd.DataFrame({'이름': ['홍길동', '１２３', '---', 'ㄱㄴ']})
+        issue = AccuracyChecker(df)._check_korean_format('이름')
+        self.assertEqual(sorted(issue['details']['examples']), ['---', 'ㄱㄴ'])
+
+
+def _format_issues(df):
+    return {issue['title']: issue['details']['error_count'] for issue in AccuracyChecker(df).check()['issues']}
+
+
+class RuleCacheTest(unittest.TestCase):
+    def setUp(self):
+        accuracy._rule_cache.clear()
+
+    def test_unchanged_column_is_not_rescanned(self):
+        df = pd.DataFrame({'email': ['a@b.kr', 'bad', 'c@d.com'], 'phone': ['010-1234-5678', 'x', '02 123 4567']})
+        first = _format_issues(df)
+        with mock.patch.object(accuracy, '_regex_mask', wraps=accuracy._regex_mask) as regex_mask:
+            second = _format_issues(df.copy())
+        self.assertEqual(second, first)
+        regex_mask.assert_not_called()
+
+    def test_changed_column_is_rescanned(self):
+        df = pd.DataFrame({'email': ['a@b.kr', 'bad', 'c@d.com'], '등록일자': ['2024-01-01', '2024-02-30', '2024-02-01']})
+        self.assertEqual(_format_issues(df), {'컬럼 "email"의 이메일 형식 오류': 1, '컬럼 "등록일자"의 날짜 유효성 오류': 1})
+
+        changed = df.assign(email=['a@b.kr', 'bad', 'worse'], 등록일자=['2024-01-01', '2024-12-01', '2024-02-01'])
+        self.assertEqual(_format_issues(changed), {'컬럼 "email"의 이메일 형식 오류': 2})
+
+        renamed = df.rename(columns={'email': 'mail'})
+        self.assertIn('컬럼 "mail"의 이메일 형식 오류', _format_issues(renamed))
+
+    def test_same_text_with_other_value_types_is_rescanned(self):
+        # object 컬럼 해시는 값의 문자열 표현 기준이므로 값 타입이 달라도 같은 해시가 나올 수 있음
+        as_numbers = pd.DataFrame({'등록일자': pd.Series([20240101, 20240230], dtype=object)})
+        as_text = pd.DataFrame({'등록일자': ['20240101', '20240230']})
+        for df in (as_numbers, as_text, pd.DataFrame({'등록일자': pd.Series([20240101, '20240230'], dtype=object)})):
+            with self.subTest(values=df['등록일자'].tolist()):
+                checker = AccuracyChecker(df)
+                self.assertEqual(checker._cached_rule(checker._check_date_format, '등록일자'),
+                                 checker._check_date_format('등록일자'))
+
+    def test_cached_issue_is_a_copy(self):
+        df = pd.DataFrame({'email': ['a@b.kr', 'bad']})
+        AccuracyChecker(df).check()['issues'][0]['details']['examples'].append('mutated')
+        examples = AccuracyChecker(df).check()['issues'][0]['details']['examples']
+        self.assertEqual(examples, ['bad'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+샘플 데이터 진단 결과 회귀 테스트
+
+tests/data/baseline_results.json은 컬럼별 pandas 연산으로 구현된 이전 진단 모듈로
+샘플 CSV를 진단한 결과(점수, 이슈 제목/설명)입니다. 벡터화/캐시/표본 검사로 바뀐 현재 모듈이
+같은 결과를 내는지 검증합니다. (현재 시각에 따라 결과가 달라지는 정확성/적시성 진단 제외)
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from modules.runner import CHECKERS
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE = json.loads((Path(__file__).resolve().parent / 'data' / 'baseline_results.json').read_text(encoding='utf-8'))
+
+# 빠른 모드를 지원하는 지표 (표본 크기를 작게 지정해 샘플 데이터에서도 표본 검사 경로를 사용)
+FAST_MODE_CHECKS = ('completeness', 'consistency')
+
+
+def _summary(result):
+    return {
+        'score': float(result['score']),
+        'issues': sorted([issue['title'], issue['description']] for issue in result['issues']),
+    }
+
+
+class BaselineResultsTest(unittest.TestCase):
+    def test_sample_files_match_baseline(self):
+        for path, expected in BASELINE.items():
+            df = pd.read_csv(ROOT / path)
+            for name, result in expected.items():
+                with self.subTest(file=path, check=name):
+                    self.assertEqual(_summary(CHECKERS[name](df).check()), result)
+
+    def test_fast_mode_matches_exact_mode(self):
+        # 표본 검사 결과는 details['sampled']로 표시되며, 그 외 이슈와 점수는 전체 검사와 같아야 함
+        for path, expected in BASELINE.items():
+            df = pd.read_csv(ROOT / path)
+            for name in FAST_MODE_CHECKS:
+                with self.subTest(file=path, check=name):
+                    result = CHECKERS[name](df, fast_mode=True, sample_threshold=max(len(df) // 2, 2)).check()
+                    sampled = [issue for issue in result['issues'] if issue['details'].get('sampled')]
+                    exact = [[issue['title'], issue['description']] for issue in result['issues'] if issue not in sampled]
+                    expected_exact = [
+                        issue for issue in expected[name]['issues']
+                        if issue[0] not in {sampled_issue['title'] for sampled_issue in sampled}
+                    ]
+                    self.assertEqual(sorted(exact), expected_exact)
+                    if not sampled:
+                        self.assertEqual(float(result['score']), expected[name]['score'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+완전성 진단 모듈 테스트
+
+숫자형 블록 단위로 계산하는 이상치 검사가 컬럼별 pandas 계산과 같은 결과를 내는지,
+빈 데이터 등 경계 입력에서도 진단이 완료되는지 검증합니다.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from modules.completeness import CompletenessChecker
+
+
+def _reference_outliers(series):
+    """컬럼별 pandas 연산으로 계산한 (방법, 이상치 개수) - 블록 계산 이전 구현과 동일한 규칙"""
+    non_null = series.dropna()
+    if len(non_null) >= 4 and not pd.api.types.is_bool_dtype(series):
+        q1, q3 = non_null.quantile(0.25), non_null.quantile(0.75)
+        iqr = q3 - q1
+        if iqr != 0:
+            outliers = series[(series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)]
+            if len(outliers) > 0:
+                return 'IQR', len(outliers)
+    if len(non_null) > 3:
+        std = non_null.std()
+        if std and std != 0:
+            threshold = 1.5 if len(non_null) <= 10 else 2.0
+            outliers = non_null[((non_null - non_null.mean()) / std).abs() > threshold]
+            if len(outliers) > 0:
+                return 'Z-score', len(outliers)
+    return None
+
+
+def _outlier_summary(result):
+    return {
+        issue['details']['column']: (issue['details']['method'], issue['details']['outlier_count'])
+        for issue in result['issues'] if 'method' in issue['details']
+    }
+
+
+class OutlierTest(unittest.TestCase):
+    def test_block_statistics_match_per_column_reference(self):
+        rng = np.random.default_rng(0)
+        normal = rng.normal(50, 10, 500)
+        normal[[3, 70]] = [400, -300]
+        with_nulls = rng.normal(size=500)
+        with_nulls[::7] = np.nan
+        df = pd.DataFrame({
+            'normal': normal,
+            'with_nulls': with_nulls,
+            'integers': rng.integers(0, 100, 500),
+            'constant': np.full(500, 3.0),
+            'skewed': np.r_[np.zeros(480), rng.normal(5, 1, 20)],
+            'flag': rng.integers(0, 2, 500).astype(bool),
+        })
+        expected = {col: _reference_outliers(df[col]) for col in df.columns}
+        expected = {col: value for col, value in expected.items() if value is not None}
+        self.assertEqual(_outlier_summary(CompletenessChecker(df).check()), expected)
+
+    def test_small_column_matches_reference(self):
+        df = pd.DataFrame({'value': [10, 11, 10, 12, 11, 10, 30]})
+        self.assertEqual(_outlier_summary(CompletenessChecker(df).check()), {'value': _reference_outliers(df['value'])})
+
+    def test_random_small_columns_match_reference(self):
+        # 값이 적은 컬럼은 IQR에서 빠지고 Z-score(임계값 1.5/2.0)로 판정되는 경우가 많음
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame({
+            f'c{i}': np.r_[rng.integers(0, 5, 8), rng.integers(0, 12, 1)].astype(float)
+            for i in range(60)
+        })
+        df.iloc[::4, ::3] = np.nan
+        expected = {col: _reference_outliers(df[col]) for col in df.columns}
+        expected = {col: value for col, value in expected.items() if value is not None}
+        self.assertIn('Z-score', {method for method, _ in expected.values()})
+        self.assertEqual(_outlier_summary(CompletenessChecker(df).check()), expected)
+
+
+class EdgeCaseTest(unittest.TestCase):
+    def _check(self, df):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            return CompletenessChecker(df).check()
+
+    def test_empty_numeric_frame(self):
+        for columns in (['a'], ['a', 'b'], ['a', 'b', 'c']):
+            with self.subTest(columns=columns):
+                df = pd.DataFrame({col: pd.Series(dtype='float64') for col in columns})
+                result = self._check(df)
+                self.assertEqual(_outlier_summary(result), {})
+                self.assertEqual(result['score'], 16.0)
+                self.assertEqual(result['metrics']['전체 셀 수'], 0)
+
+    def test_all_null_frame(self):
+        df = pd.DataFrame({'x': [np.nan] * 5, 'name': [None] * 5})
+        result = self._check(df)
+        titles = sorted(issue['title'] for issue in result['issues'])
+        self.assertEqual(titles, ['기본키 미정의 또는 중복 레코드', '미사용 또는 무의미한 컬럼 발견',
+                                  '컬럼 "name"의 필수값 누락', '컬럼 "x"의 필수값 누락'])
+        self.assertEqual(result['score'], 4.0)
+
+    def test_single_row_frame(self):
+        df = pd.DataFrame({'id': [1], 'price': [3.5], 'email': ['a@b.co']})
+        result = self._check(df)
+        self.assertEqual([issue['title'] for issue in result['issues']], ['미사용 또는 무의미한 컬럼 발견'])
+        self.assertEqual(result['score'], 92.0)
+
+
+class FastModeTest(unittest.TestCase):
+    def test_fast_mode_matches_exact_mode(self):
+        n = 5000
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame({
+            'id': np.arange(n),
+            'amount_text': rng.integers(0, 10_000, n).astype(str).astype(object),
+            'label': rng.choice(['a', 'b', None], n).astype(object),
+            'value': rng.normal(size=n),
+        })
+        exact = CompletenessChecker(df).check()
+        fast = CompletenessChecker(df, fast_mode=True, sample_threshold=500).check()
+        self.assertEqual(fast['score'], exact['score'])
+        self.assertEqual([issue['title'] for issue in fast['issues']], [issue['title'] for issue in exact['issues']])
+        self.assertEqual(fast['metrics'], exact['metrics'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+일관성 진단 모듈 테스트
+
+Arrow 커널로 계산하는 날짜 형식 분류와 최대 문자열 길이가 pandas 문자열 연산과 같은 결과를 내는지,
+경계 입력과 빠른 모드에서도 진단이 일관되는지 검증합니다.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from modules import consistency
+from modules.consistency import _DATE_FORMATS, ConsistencyChecker, _count_date_formats, _max_strlen
+
+# 날짜 형식 검사에서 엔진별 동작이 갈리기 쉬운 값 (끝 개행, 전각 숫자, 접두/접미 문자 등)
+DATE_VALUES = [
+    '2024-01-01', '2024/01/01', '20240101', '01-02-2024', '01/02/2024', '2024-01-01 10:00',
+    '20240101\n', '20240101\n\n', '2024010', '202401011', '２０２４-０１-０１', ' 2024-01-01',
+    'x2024-01-01', '24-01-01', '', 'abc',
+]
+
+
+def _reference_date_formats(values):
+    """형식별 pandas str.match 건수 ({그룹명: 건수}, 0건 제외)"""
+    text = pd.Series(values, dtype=object).astype(str)
+    counts = {group: int(text.str.match(pattern).sum()) for group, (_, pattern) in _DATE_FORMATS.items()}
+    return {group: count for group, count in counts.items() if count > 0}
+
+
+def _nonzero(counts):
+    return {group: count for group, count in counts.items() if count > 0}
+
+
+class DateFormatTest(unittest.TestCase):
+    def test_count_matches_pandas_reference(self):
+        values = pd.Series(DATE_VALUES * 3, dtype=object)
+        expected = _reference_date_formats(values)
+        self.assertEqual(_nonzero(_count_date_formats(values)), expected)
+        with mock.patch.object(consistency, 'pa', None):
+            self.assertEqual(_nonzero(_count_date_formats(values)), expected)
+
+    def test_non_string_values(self):
+        values = pd.Series([20240101, '2024-01-01', 2024.5, True], dtype=object)
+        self.assertEqual(_nonzero(_count_date_formats(values)), _reference_date_formats(values))
+
+
+class MaxStrlenTest(unittest.TestCase):
+    def test_matches_astype_str(self):
+        cases = {
+            'text': ['a', 'abcd', '한글문자열', None],
+            'with_nan': ['a', np.nan, 'bb'],
+            'only_null': [None, np.nan],
+            'mixed': [1, 'abc', 12345.5, None, True],
+            'emoji': ['😀😀', 'ab'],
+            'empty': [],
+        }
+        for name, values in cases.items():
+            with self.subTest(case=name):
+                series = pd.Series(values, dtype=object)
+                expected = series.astype(str).str.len().max()
+                result = _max_strlen(series)
+                if pd.isna(expected):
+                    self.assertTrue(pd.isna(result))
+                else:
+                    self.assertEqual(result, expected)
+
+
+class ConsistencyCheckTest(unittest.TestCase):
+    def test_edge_frames(self):
+        frames = {
+            'empty': (pd.DataFrame({'user_id': pd.Series(dtype='int64'), 'reg_date': pd.Series(dtype=object)}), 100.0),
+            'all_null': (pd.DataFrame({'user_id': [np.nan] * 3, 'reg_date': [None] * 3}), 32.5),
+            'one_row': (pd.DataFrame({'user_id': [1], 'reg_date': ['2024-01-01']}), 100.0),
+        }
+        for name, (df, score) in frames.items():
+            with self.subTest(frame=name):
+                self.assertEqual(ConsistencyChecker(df).check()['score'], score)
+
+    def test_mixed_date_formats(self):
+        df = pd.DataFrame({'reg_date': ['2024-01-01', '2024/01/02', '20240103', None, '2024-01-04']})
+        issue, = [issue for issue in ConsistencyChecker(df).check()['issues'] if 'format_counts' in issue['details']]
+        self.assertEqual(issue['details']['format_counts'], {'YYYY-MM-DD': 2, 'YYYY/MM/DD': 1, 'YYYYMMDD': 1})
+
+    def test_fast_mode_marks_sampled_date_formats(self):
+        n = 3000
+        df = pd.DataFrame({
+            'row_no': np.arange(n),
+            'reg_date': np.where(np.arange(n) % 3 == 0, '2024/01/01', '2024-01-01').astype(object),
+        })
+        exact, = ConsistencyChecker(df).check()['issues']
+        fast, = ConsistencyChecker(df, fast_mode=True, sample_threshold=300).check()['issues']
+        self.assertEqual(fast['title'], exact['title'])
+        self.assertTrue(fast['details']['sampled'])
+        self.assertNotIn('sampled', exact['details'])
+        self.assertEqual(sorted(fast['details']['format_counts']), sorted(exact['details']['format_counts']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+데이터 로드 모듈 테스트
+
+고속 파싱(pyarrow CSV 파서) 결과가 pandas 기본 파서와 같은 타입과 값을 갖는지 검증합니다.
+"""
+
+import io
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from modules.loader import FAST_PARSE_AVAILABLE, _read_csv_arrow, read_csv
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# pandas 기본 파서와 타입 추론이 갈리기 쉬운 입력
+PARITY_CASES = {
+    'header_only': b'a,b\n',
+    'all_null_column': b'a,b\n,1\n,2\n',
+    'int64_overflow': b'id,v\n9223372036854775808,1\n2,2\n',
+    'twenty_digit_ids': b'id,v\n12345678901234567890,1\n98765432109876543210,2\n',
+    'beyond_uint64': b'id,v\n123456789012345678901234,1\n2,2\n',
+    'overflow_with_null': b'id,v\n12345678901234567890,1\n,2\n',
+    'plus_sign_integers': b'a,b\n-1,+2\n3,4\n',
+    'plus_sign_float': b'a\n+1.5\n2\n',
+    'integral_floats': b'a\n1.0\n2.0\n',
+    'exponent': b'a\n1e5\n2\n',
+    'nulls_and_text': b'a,b\nx,1\nNULL,\n,3\n',
+    'dates': b'd,n\n2024-01-01,1\n2024-02-30,2\n',
+}
+
+
+@unittest.skipUnless(FAST_PARSE_AVAILABLE, 'pyarrow 미설치')
+class ReadCsvParityTest(unittest.TestCase):
+    def assert_parity(self, data):
+        expected = pd.read_csv(io.BytesIO(data))
+        pd.testing.assert_frame_equal(read_csv(data), expected)
+
+    def test_edge_cases_match_pandas(self):
+        for name, data in PARITY_CASES.items():
+            with self.subTest(case=name):
+                self.assert_parity(data)
+
+    def test_sample_files_match_pandas(self):
+        for path in sorted([ROOT / 'sample.csv', *(ROOT / 'sample_data').glob('*.csv')]):
+            with self.subTest(file=path.name):
+                self.assert_parity(path.read_bytes())
+
+    def test_integer_text_inferred_as_double_falls_back(self):
+        for name in ('int64_overflow', 'plus_sign_integers', 'overflow_with_null'):
+            with self.subTest(case=name), self.assertRaises(ValueError):
+                _read_csv_arrow(PARITY_CASES[name])
+
+    def test_float_text_stays_on_arrow_path(self):
+        df = _read_csv_arrow(PARITY_CASES['integral_floats'])
+        self.assertEqual(df['a'].dtype, 'float64')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+진단 실행 모듈 테스트
+
+병렬 실행 결과가 체커를 직접 실행한 결과와 같은지, 지표별 워커가 재진단 시 재사용되는지 검증합니다.
+"""
+
+import os
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from modules import runner
+from modules.runner import CHECKERS, iter_checks
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _summary(result):
+    return result['score'], [issue['title'] for issue in result['issues']]
+
+
+class IterChecksTest(unittest.TestCase):
+    def test_results_match_direct_checks(self):
+        df = pd.read_csv(ROOT / 'sample_data' / 'sample_comprehensive_test.csv')
+        results = dict(iter_checks(list(CHECKERS), df))
+        self.assertEqual(sorted(results), sorted(CHECKERS))
+        for name, checker in CHECKERS.items():
+            with self.subTest(check=name):
+                self.assertEqual(_summary(results[name]), _summary(checker(df).check()))
+
+    def test_options_are_passed_per_check(self):
+        df = pd.DataFrame({'email': ['a@b.kr', 'bad'] * 50})
+        results = dict(iter_checks(['accuracy'], df, {'accuracy': {'fast_mode': True, 'sample_threshold': 10}}))
+        self.assertEqual(_summary(results['accuracy']), _summary(CHECKERS['accuracy'](df).check()))
+
+    def test_no_checks(self):
+        self.assertEqual(list(iter_checks([], pd.DataFrame())), [])
+
+    def test_check_reuses_its_worker(self):
+        # 프로세스 내 컬럼 결과 캐시가 유지되도록 같은 지표는 같은 워커에서 실행
+        first = runner._get_executor('accuracy').submit(os.getpid).result()
+        list(iter_checks(['accuracy', 'security'], pd.DataFrame({'a': [1, 2]})))
+        second = runner._get_executor('accuracy').submit(os.getpid).result()
+        self.assertEqual(first, second)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+보안성 진단 모듈 테스트
+
+문자열 메서드와 사전 필터로 바꾼 개인정보/암호화 검사가 컬럼별 정규식 검사와 같은 결과를 내는지 검증합니다.
+"""
+
+import re
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from modules.security import _PII_PATTERNS, SecurityChecker, _is_long_number
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_LONG_NUMBER_RE = re.compile(r'^\d{10,}$')
+
+
+def _reference_issues(df):
+    """컬럼별 pandas 정규식 검사로 계산한 {제목: 건수} (개인정보 / 암호화 필요 검사)"""
+    expected = {}
+    for col in df.columns:
+        if df[col].dtype != 'object' or df[col].count() == 0:
+            continue
+        values = df[col].dropna().astype(str)
+        if any(keyword in col.lower() for keyword in ['주민', 'ssn', 'rrn', '이메일', 'email', '전화', 'phone', 'tel', '카드', 'card']):
+            for pii_type, pattern in _PII_PATTERNS.items():
+                matches = int(values.str.contains(pattern.pattern, regex=True).sum())
+                if matches > 0:
+                    expected[f'컬럼 "{col}"에 {pii_type} 노출'] = matches
+                    break
+        long_numbers = int(values.str.match(_LONG_NUMBER_RE.pattern).sum())
+        if long_numbers > 0:
+            expected[f'컬럼 "{col}"의 암호화 필요성 검토'] = long_numbers
+    return expected
+
+
+def _counted_issues(result):
+    return {issue['title']: issue['details']['count'] for issue in result['issues'] if 'count' in issue['details']}
+
+
+class LongNumberTest(unittest.TestCase):
+    def test_matches_regex(self):
+        values = [
+            '0123456789', '0123456789\n', '0123456789\n\n', '\n0123456789', '0123456789 ',
+            '012345678', '012345678\n', '０１２３４５６７８９', '٠١٢٣٤٥٦٧٨٩', '12345678901234567890',
+            '1234567890.0', '-1234567890', '', '\n', '¹²³⁴⁵⁶⁷⁸⁹⁰',
+        ]
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEqual(_is_long_number(value), _LONG_NUMBER_RE.match(value) is not None)
+
+
+class SecurityCheckTest(unittest.TestCase):
+    def test_counts_match_regex_reference(self):
+        df = pd.DataFrame({
+            'email': ['a@b.kr', 'none', None, 'x.y@z.com'],
+            '전화번호': ['010-1234-5678', '02-123-4567', '01012345678', None],
+            '주민번호': ['900101-1234567', 'x', 'y', 'z'],
+            'card_no': ['1234-5678-9012-3456', '1234567890123456', '1234567890123456\n', None],
+            'memo': ['0123456789\n', '12345', 'abc', '９８７６５４３２１０'],
+        })
+        self.assertEqual(_counted_issues(SecurityChecker(df).check()), _reference_issues(df))
+
+    def test_sample_files_match_regex_reference(self):
+        for path in sorted([ROOT / 'sample.csv', *(ROOT / 'sample_data').glob('*.csv')]):
+            with self.subTest(file=path.name):
+                df = pd.read_csv(path)
+                self.assertEqual(_counted_issues(SecurityChecker(df).check()), _reference_issues(df))
+
+    def test_mixed_value_types(self):
+        df = pd.DataFrame({'account_no': pd.Series([1234567890, '1234567890', 12.5, None], dtype=object)})
+        self.assertEqual(_counted_issues(SecurityChecker(df).check()), {'컬럼 "account_no"의 암호화 필요성 검토': 2})
+
+    def test_edge_frames(self):
+        frames = {
+            'empty': pd.DataFrame({'email': pd.Series(dtype=object), 'n': pd.Series(dtype=float)}),
+            'all_null': pd.DataFrame({'email': [None] * 3, 'n': [np.nan] * 3}),
+            'one_row': pd.DataFrame({'email': ['a@b.co'], 'n': [1.0]}),
+        }
+        expected = {'empty': (100, []), 'all_null': (100, []), 'one_row': (92, ['컬럼 "email"에 이메일 노출'])}
+        for name, df in frames.items():
+            with self.subTest(frame=name):
+                result = SecurityChecker(df).check()
+                self.assertEqual((result['score'], [issue['title'] for issue in result['issues']]), expected[name])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+적시성 진단 모듈 테스트
+
+NumPy 배열로 계산하는 갱신 주기 통계가 pandas 정렬/차분 계산과 같은 결과를 내는지,
+날짜가 적은 컬럼에서도 경고 없이 진단되는지 검증합니다.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from modules.timeliness import TimelinessChecker
+
+
+def _reference_interval(dates):
+    """pandas 정렬/차분으로 계산한 불규칙 갱신 주기 (평균, 표준편차) - 없으면 None"""
+    diffs = pd.to_datetime(dates, errors='coerce').dropna().sort_values().diff().dt.days.dropna()
+    if len(diffs) > 0:
+        avg, std = diffs.mean(), diffs.std()
+        if std > avg * 0.5:
+            return round(avg, 1), round(std, 1)
+    return None
+
+
+class _TimelinessTestCase(unittest.TestCase):
+    def check(self, df):
+        """진단 실행 (규칙 예외는 체커 내부에서 무시되므로 수치 연산 경고는 기록하여 검사)"""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', RuntimeWarning)
+            result = TimelinessChecker(df).check()
+        self.assertEqual([str(warning.message) for warning in caught if warning.category is RuntimeWarning], [])
+        return result
+
+
+def _interval_issues(result):
+    return {
+        issue['details']['column']: (issue['details']['avg_interval_days'], issue['details']['std_interval_days'])
+        for issue in result['issues'] if 'avg_interval_days' in issue['details']
+    }
+
+
+class UpdateFrequencyTest(_TimelinessTestCase):
+    def test_interval_stats_match_pandas_reference(self):
+        rng = np.random.default_rng(0)
+        base = pd.Timestamp('2024-01-01')
+        columns = {
+            'regular_date': [base + pd.Timedelta(days=7 * i) for i in range(50)],
+            'irregular_date': list(base + pd.to_timedelta(np.sort(rng.integers(0, 400, 50)), unit='D')),
+            'unsorted_date': list(base + pd.to_timedelta(rng.integers(0, 30, 50), unit='D')),
+            'text_date': [f'2024-{m:02d}-{d:02d}' for m, d in zip(rng.integers(1, 13, 50), rng.integers(1, 29, 50))],
+            'time_with_hours': list(base + pd.to_timedelta(rng.integers(0, 10_000, 50), unit='h')),
+        }
+        df = pd.DataFrame(columns)
+        df.loc[::9, 'text_date'] = None
+        expected = {col: _reference_interval(df[col]) for col in df.columns}
+        expected = {col: value for col, value in expected.items() if value is not None}
+        self.assertTrue(expected)
+        self.assertEqual(_interval_issues(self.check(df)), expected)
+
+    def test_single_gap_has_no_interval_issue(self):
+        for dates in (['2024-01-01', '2024-03-01'], ['2024-03-01', None, '2024-01-01']):
+            with self.subTest(dates=dates):
+                self.assertEqual(_interval_issues(self.check(pd.DataFrame({'등록일자': dates}))), {})
+
+    def test_repeated_single_date(self):
+        self.assertEqual(_interval_issues(self.check(pd.DataFrame({'등록일자': ['2024-01-01'] * 3}))), {})
+
+
+class EdgeCaseTest(_TimelinessTestCase):
+    def test_edge_frames(self):
+        frames = {
+            'empty': pd.DataFrame({'등록일자': pd.Series(dtype=object), 'n': pd.Series(dtype=float)}),
+            'all_null': pd.DataFrame({'등록일자': [None] * 3, 'n': [np.nan] * 3}),
+            'unparseable': pd.DataFrame({'등록일자': ['abc', 'def']}),
+            'one_row': pd.DataFrame({'등록일자': ['2024-01-01'], 'n': [1.0]}),
+        }
+        for name, df in frames.items():
+            with self.subTest(frame=name):
+                result = self.check(df)
+                self.assertEqual(result['metrics']['날짜 컬럼 수'], 1)
+                self.assertEqual(_interval_issues(result), {})
+
+    def test_future_dates_are_counted(self):
+        future = (pd.Timestamp.now() + pd.Timedelta(days=30)).strftime('%Y-%m-%d')
+        result = self.check(pd.DataFrame({'수정일자': ['2024-01-01', future, future]}))
+        counts = {issue['title']: issue['details'].get('future_count') for issue in result['issues']}
+        self.assertEqual(counts.get('컬럼 "수정일자"에 미래 날짜 존재'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+유용성 진단 모듈 테스트
+
+정수 코드 빈도로 계산하는 상위 값 목록이 value_counts와 같은 결과를 내는지,
+경계 입력에서도 진단이 완료되는지 검증합니다.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from modules.usability import UsabilityChecker, _top_values
+
+
+def _reference_top_values(series, n=5):
+    return list(series.value_counts().head(n).to_dict().items())
+
+
+class TopValuesTest(unittest.TestCase):
+    def test_matches_value_counts(self):
+        rng = np.random.default_rng(0)
+        cases = {
+            'text': pd.Series(rng.choice(list('abcdefgh'), 1000, p=[.3, .2, .15, .1, .1, .05, .05, .05]), dtype=object),
+            # 빈도가 같은 값은 첫 등장 순서를 유지해야 함
+            'ties': pd.Series(['z', 'y', 'x', 'y', 'z', 'x', 'w', 'v', 'u', 'u'], dtype=object),
+            'with_nulls': pd.Series(['a', None, 'b', np.nan, 'a', None, 'c'], dtype=object),
+            'mixed': pd.Series([1, '1', 2.5, 'a', 1, True, 'a'], dtype=object),
+            'only_null': pd.Series([None, np.nan], dtype=object),
+            'numeric': pd.Series(rng.integers(0, 4, 200)),
+            'empty': pd.Series([], dtype=object),
+        }
+        for name, series in cases.items():
+            with self.subTest(case=name):
+                self.assertEqual(_top_values(series), _reference_top_values(series))
+
+    def test_limit(self):
+        series = pd.Series(list('aabbbcdddde'), dtype=object)
+        self.assertEqual(_top_values(series, n=2), _reference_top_values(series, n=2))
+
+
+class UsabilityCheckTest(unittest.TestCase):
+    def _check(self, df):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            return UsabilityChecker(df).check()
+
+    def test_low_diversity_top_values(self):
+        df = pd.DataFrame({'category': ['b'] * 700 + ['a'] * 290 + ['c'] * 10})
+        issue, = [issue for issue in self._check(df)['issues'] if 'top_values' in issue['details']]
+        self.assertEqual(issue['details']['top_values'], [('b', 700), ('a', 290), ('c', 10)])
+
+    def test_edge_frames(self):
+        frames = {
+            'empty': (pd.DataFrame({'category': pd.Series(dtype=object), 'amount': pd.Series(dtype='float64')}),
+                      13.2, ['데이터 레코드 수 부족']),
+            'all_null': (pd.DataFrame({'category': [None] * 3, 'amount': [np.nan] * 3}),
+                         3.6, ['데이터 레코드 수 부족', '컬럼 "category"의 데이터 부족', '컬럼 "amount"의 데이터 부족']),
+            'one_row': (pd.DataFrame({'category': ['a'], 'amount': [1.0]}), 31.2, ['데이터 레코드 수 부족']),
+        }
+        for name, (df, score, titles) in frames.items():
+            with self.subTest(frame=name):
+                result = self._check(df)
+                self.assertEqual(result['score'], score)
+                self.assertEqual([issue['title'] for issue in result['issues']], titles)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+공통 유틸리티 테스트
+
+NumPy/Numba 커널과 청크 단위 계산으로 바꾼 헬퍼가 pandas 기준 계산과 같은 결과를 내는지 검증합니다.
+"""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from modules import utils
+from modules.utils import (
+    calculate_uniqueness_metrics, count_later, count_out_of_range, detect_pattern_deviation,
+    safe_is_unique, safe_outlier_detection, scan_range, stride_sample
+)
+
+
+def _series_cases():
+    rng = np.random.default_rng(0)
+    with_nulls = rng.normal(size=300)
+    with_nulls[::9] = np.nan
+    return {
+        'normal': pd.Series(np.r_[rng.normal(size=300), [15.0, -12.0]]),
+        'with_nulls': pd.Series(with_nulls),
+        'integers': pd.Series(np.r_[rng.integers(0, 10, 300), [500]]),
+        'nullable_int': pd.Series([1, 2, None, 4, 5, 100], dtype='Int64'),
+        'constant': pd.Series(np.full(20, 7.0)),
+        'single': pd.Series([3.0]),
+        'only_null': pd.Series([np.nan, np.nan]),
+        'empty': pd.Series([], dtype='float64'),
+        'text': pd.Series(['ab', 'abc', None, 'abcd'] * 30 + ['x' * 200], dtype=object),
+        'mixed': pd.Series([1, '1', 2.5, None, 'abc', 1], dtype=object),
+    }
+
+
+class UniqueTest(unittest.TestCase):
+    def test_matches_pandas_across_chunks(self):
+        cases = {
+            'unique': pd.Series([f'v{i}' for i in range(50)], dtype=object),
+            'duplicate_in_first_chunk': pd.Series(['a', 'b', 'a'] + [f'v{i}' for i in range(50)], dtype=object),
+            'duplicate_across_chunks': pd.Series([f'v{i}' for i in range(50)] + ['v3'], dtype=object),
+            'nulls_only_repeat': pd.Series(['a', None, 'b', np.nan, None, 'c'], dtype=object),
+            'empty': pd.Series([], dtype=object),
+            'numeric': pd.Series([1, 2, 3, 2]),
+        }
+        for chunk_size in (1, 4, 7, 1 << 16):
+            for name, series in cases.items():
+                with self.subTest(chunk_size=chunk_size, case=name), \
+                        mock.patch.object(utils, '_UNIQUE_CHUNK_SIZE', chunk_size):
+                    self.assertEqual(safe_is_unique(series), series.dropna().is_unique)
+
+
+class StrideSampleTest(unittest.TestCase):
+    def test_sample_is_bounded_and_ordered(self):
+        series = pd.Series(np.arange(1000))
+        for limit in (1, 3, 7, 100, 999):
+            with self.subTest(limit=limit):
+                sample = stride_sample(series, limit)
+                self.assertLessEqual(len(sample), limit)
+                self.assertEqual(sample.iloc[0], 0)
+                self.assertTrue(sample.index.is_monotonic_increasing)
+
+    def test_small_series_is_returned_as_is(self):
+        series = pd.Series(np.arange(10))
+        self.assertIs(stride_sample(series, 10), series)
+        self.assertIs(stride_sample(series, None), series)
+
+
+class UniquenessMetricsTest(unittest.TestCase):
+    def test_matches_pandas_reference(self):
+        for name, series in _series_cases().items():
+            with self.subTest(case=name):
+                counts = series.value_counts()
+                total = len(series)
+                once = int((counts == 1).sum())
+                self.assertEqual(calculate_uniqueness_metrics(series), {
+                    'total_count': total,
+                    'unique_count': series.nunique(),
+                    'unique_once_count': once,
+                    'duplicate_occurrences': int(counts[counts > 1].sum()),
+                    'uniqueness_rate': round(once / total * 100, 2) if total > 0 else 0,
+                })
+
+
+class PatternDeviationTest(unittest.TestCase):
+    def test_matches_pandas_reference(self):
+        for name, series in _series_cases().items():
+            with self.subTest(case=name):
+                if pd.api.types.is_numeric_dtype(series):
+                    values = series
+                else:
+                    values = series.astype(str).str.len()
+                std = values.std()
+                expected = int((((values - values.mean()) / std).abs() > 3).sum()) if std and std != 0 else 0
+                self.assertEqual(detect_pattern_deviation(series), expected)
+
+
+class OutlierDetectionTest(unittest.TestCase):
+    def test_matches_pandas_quantile(self):
+        for name, series in _series_cases().items():
+            with self.subTest(case=name):
+                expected = pd.Series(dtype='object')
+                if pd.api.types.is_numeric_dtype(series):
+                    clean = series.dropna()
+                    if len(clean) >= 4:
+                        q1, q3 = clean.quantile(0.25), clean.quantile(0.75)
+                        iqr = q3 - q1
+                        if iqr != 0:
+                            expected = series[(series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)]
+                result = safe_outlier_detection(series)
+                self.assertEqual(result.index.tolist(), expected.index.tolist())
+                self.assertEqual(result.tolist(), expected.tolist())
+
+    def test_bool_series_has_no_outliers(self):
+        self.assertTrue(safe_outlier_detection(pd.Series([True] * 20 + [False])).empty)
+
+
+class RangeKernelTest(unittest.TestCase):
+    def test_range_counts_match_numpy(self):
+        rng = np.random.default_rng(2)
+        arrays = {
+            'normal': rng.normal(size=10_000),
+            'with_nan': np.where(rng.random(1000) < 0.2, np.nan, rng.normal(size=1000)),
+            'in_range': rng.uniform(-0.5, 0.5, 100),
+            'only_nan': np.full(5, np.nan),
+            'empty': np.array([], dtype=np.float64),
+        }
+        for name, arr in arrays.items():
+            with self.subTest(case=name):
+                expected = int(np.count_nonzero((arr < -1) | (arr > 1)))
+                self.assertEqual(count_out_of_range(arr, -1.0, 1.0), expected)
+                count, lowest, highest = scan_range(arr, -1.0, 1.0)
+                self.assertEqual(count, expected)
+                if expected:
+                    self.assertEqual(lowest, np.nanmin(arr))
+                    self.assertEqual(highest, np.nanmax(arr))
+
+    def test_count_later_ignores_nat(self):
+        start = pd.to_datetime(pd.Series(['2024-01-02', '2024-01-01', None, '2024-03-01', '2024-05-01']))
+        end = pd.to_datetime(pd.Series(['2024-01-01', '2024-01-01', '2023-01-01', None, '2024-06-01']))
+        self.assertEqual(count_later(start, end), int((start > end).sum()))
+
+
+if __name__ == '__main__':
+    unittest.main()